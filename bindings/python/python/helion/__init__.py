@@ -15,18 +15,150 @@ Example:
     >>> plot = helion.scatter(x, y, color="#FF5733")
 """
 
+import warnings
+
+import numpy as np
+
 from ._helion import (
     __version__,
     Point2D,
+    Point2DArray,
     Color,
     PyScatterPlot as ScatterPlot,
-    scatter,
+    scatter as _scatter,
+    minmax as _minmax,
 )
 
 __all__ = [
     "__version__",
     "Point2D",
+    "Point2DArray",
     "Color",
     "ScatterPlot",
     "scatter",
+    "random_points",
+    "minmax",
 ]
+
+# Dtypes the extension reads in place; anything else is cast to float32
+_NATIVE_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+# DLPack device type for CPU memory (DLDeviceType.kDLCPU)
+_DLPACK_CPU = 1
+
+
+def _to_host(a):
+    """Bring a tensor from another framework into host memory.
+
+    Tensors exporting DLPack on the CPU (PyTorch, JAX, CuPy pinned memory,
+    ...) become zero-copy NumPy views via ``np.from_dlpack``; the view keeps
+    the producer's memory alive. wgpu cannot import CUDA allocations, so
+    device arrays (CuPy, Numba, PyTorch, JAX) are copied to the host once
+    through their own library, which is the only copy made before the data
+    reaches the GPU buffer. NumPy arrays and other host objects are returned
+    unchanged.
+    """
+    if isinstance(a, np.ndarray):
+        return a
+    if hasattr(a, "__dlpack_device__") and hasattr(np, "from_dlpack"):
+        device_type, _ = a.__dlpack_device__()
+        if device_type == _DLPACK_CPU:
+            return np.from_dlpack(a)
+    if not hasattr(a, "__cuda_array_interface__"):
+        return a
+    if hasattr(a, "get"):  # CuPy
+        return a.get()
+    if hasattr(a, "copy_to_host"):  # Numba
+        return a.copy_to_host()
+    if hasattr(a, "cpu"):  # PyTorch
+        return a.detach().cpu().numpy()
+    if hasattr(a, "__array__"):  # JAX and other array-likes
+        return np.asarray(a)
+    raise TypeError(
+        f"Cannot copy {type(a).__name__} to host: expected a CuPy, Numba or PyTorch array"
+    )
+
+
+def _as_coords(a, fallback=np.float32):
+    """Return ``a`` as a contiguous array the extension can borrow without copying.
+
+    float32 and native-endian float64 arrays keep their dtype (float64 is cast
+    and normalized in a single pass on the Rust side). Everything else goes
+    through one vectorized NumPy cast to ``fallback``.
+    """
+    a = np.asarray(_to_host(a))
+    dtype = a.dtype if a.dtype in _NATIVE_DTYPES else fallback
+    return np.ascontiguousarray(a, dtype=dtype)
+
+
+def scatter(x, y, color=None, size=None, width=800.0, height=600.0, x_range=None, y_range=None):
+    """Create a scatter plot from Python lists or NumPy arrays
+
+    Args:
+        x: List, NumPy array, DLPack tensor or CUDA array of x coordinates
+        y: List, NumPy array, DLPack tensor or CUDA array of y coordinates
+        color: Optional hex color string (e.g., "#FF5733") or RGB tuple
+        size: Point size in pixels. Default is 2.0.
+        width: Viewport width in pixels. Default is 800.0.
+        height: Viewport height in pixels. Default is 600.0.
+        x_range: Optional tuple (min, max) for custom x output range. Default is [-1.0, 1.0].
+        y_range: Optional tuple (min, max) for custom y output range. Default is [-1.0, 1.0].
+
+    If x and y have different lengths, a UserWarning is emitted and only the
+    first min(len(x), len(y)) points are plotted.
+
+    The coordinates are read without holding the GIL, so other threads must
+    not write to x or y (or arrays sharing their memory) until this returns.
+
+    Returns:
+        ScatterPlot object
+    """
+    x = _as_coords(x)
+    y = _as_coords(y)
+    if len(x) != len(y):
+        n = min(len(x), len(y))
+        warnings.warn(
+            f"x and y arrays have different lengths ({len(x)} vs {len(y)}). Using {n} points.",
+            UserWarning,
+            stacklevel=2,
+        )
+        x, y = x[:n], y[:n]
+    return _scatter(
+        x, y, color=color, size=size, width=width, height=height, x_range=x_range, y_range=y_range
+    )
+
+
+def minmax(a):
+    """Return (min, max) of an array in a single SIMD pass
+
+    Reads the data once instead of twice for separate a.min() and a.max()
+    calls. NaN values are ignored; raises ValueError if nothing is left.
+    Non-float input is read as float64, so integers up to 2**53 are exact.
+    """
+    return _minmax(_as_coords(a, fallback=np.float64))
+
+
+def random_points(n, dtype=np.float32, seed=None):
+    """Generate n normally distributed (x, y) points for examples and benchmarks
+
+    Samples are written straight into preallocated arrays of the requested
+    dtype, so float32 output needs no float64 intermediate and no cast.
+
+    Args:
+        n: Number of points
+        dtype: np.float32 (default) or np.float64
+        seed: Optional seed for reproducible output
+
+    Returns:
+        Tuple (x, y) of contiguous 1-D arrays
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _NATIVE_DTYPES:
+        raise TypeError(f"random_points dtype must be float32 or float64, got {dtype}")
+    rng = np.random.default_rng(seed)
+    x = np.empty(n, dtype=dtype)
+    y = np.empty(n, dtype=dtype)
+    rng.standard_normal(dtype=dtype, out=x)
+    rng.standard_normal(dtype=dtype, out=y)
+    return x, y
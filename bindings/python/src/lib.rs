@@ -1,11 +1,164 @@
 use pyo3::prelude::*;
-use numpy::PyReadonlyArray1;
+use numpy::{PyArray1, PyArrayMethods, PyReadonlyArray1, PyUntypedArrayMethods};
 use helion_core::{ChartData, Point2D, Color, run_window};
+use helion_core::kernels::{min_max_f32, min_max_f64};
+use std::sync::Arc;
+
+/// Coordinate array borrowed from a Python object
+///
+/// Contiguous float32 and float64 NumPy arrays are borrowed in place, so the
+/// common `helion.scatter(x, y)` call never copies its inputs on the host.
+/// Anything else (lists, other dtypes, strided views) is converted once with
+/// `numpy.ascontiguousarray`.
+enum Coords<'py> {
+    F32(PyReadonlyArray1<'py, f32>),
+    F64(PyReadonlyArray1<'py, f64>),
+}
+
+impl<'py> Coords<'py> {
+    fn extract(obj: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(array) = obj.downcast::<PyArray1<f32>>() {
+            if array.is_contiguous() {
+                return Ok(Coords::F32(array.try_readonly()?));
+            }
+        } else if let Ok(array) = obj.downcast::<PyArray1<f64>>() {
+            if array.is_contiguous() {
+                return Ok(Coords::F64(array.try_readonly()?));
+            }
+        }
+
+        let np = obj.py().import_bound("numpy")?;
+        let array = np.call_method1("ascontiguousarray", (obj, np.getattr("float32")?))?;
+        Ok(Coords::F32(array.downcast_into::<PyArray1<f32>>()?.try_readonly()?))
+    }
+
+    fn len(&self) -> usize {
+        match self {
+            Coords::F32(array) => array.len(),
+            Coords::F64(array) => array.len(),
+        }
+    }
+
+    /// View the coordinates as `f32`
+    ///
+    /// float32 input is returned as-is; float64 input is cast into `scratch`.
+    /// Only needed when float32 and float64 inputs are mixed.
+    fn as_f32<'a>(&'a self, scratch: &'a mut Vec<f32>) -> PyResult<&'a [f32]> {
+        match self {
+            Coords::F32(array) => Ok(array.as_slice()?),
+            Coords::F64(array) => {
+                scratch.clear();
+                scratch.extend(array.as_slice()?.iter().map(|&v| v as f32));
+                Ok(scratch.as_slice())
+            }
+        }
+    }
+}
+
+/// Contiguous array of 2D points, stored as interleaved (x, y) float32 pairs
+///
+/// Built in one call from coordinate arrays instead of one `Point2D` object
+/// per point. `np.asarray(points)` is a zero-copy `(n, 2)` float32 view.
+#[pyclass(name = "Point2DArray")]
+struct PyPoint2DArray {
+    points: Vec<Point2D>,
+}
+
+#[pymethods]
+impl PyPoint2DArray {
+    /// Build a point array from x and y coordinate arrays
+    ///
+    /// Args:
+    ///     xs: List or NumPy array of x coordinates
+    ///     ys: List or NumPy array of y coordinates
+    ///
+    /// Raises:
+    ///     ValueError: If xs and ys have different lengths
+    #[staticmethod]
+    fn from_arrays(xs: &Bound<'_, PyAny>, ys: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let xs = Coords::extract(xs)?;
+        let ys = Coords::extract(ys)?;
+        if xs.len() != ys.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "xs and ys have different lengths ({} vs {})",
+                xs.len(), ys.len()
+            )));
+        }
+
+        let (mut x_scratch, mut y_scratch) = (Vec::new(), Vec::new());
+        let xs = xs.as_f32(&mut x_scratch)?;
+        let ys = ys.as_f32(&mut y_scratch)?;
+        let points = xs.iter().zip(ys).map(|(&x, &y)| Point2D::new(x, y)).collect();
+        Ok(Self { points })
+    }
+
+    fn __len__(&self) -> usize {
+        self.points.len()
+    }
+
+    fn __getitem__(&self, index: isize) -> PyResult<Point2D> {
+        let len = self.points.len() as isize;
+        let i = if index < 0 { index + len } else { index };
+        if i < 0 || i >= len {
+            return Err(pyo3::exceptions::PyIndexError::new_err("Point2DArray index out of range"));
+        }
+        Ok(self.points[i as usize])
+    }
+
+    /// NumPy array interface: a read-only `(n, 2)` float32 view of the points
+    #[getter]
+    fn __array_interface__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, pyo3::types::PyDict>> {
+        let typestr = if cfg!(target_endian = "little") { "<f4" } else { ">f4" };
+        let interface = pyo3::types::PyDict::new_bound(py);
+        interface.set_item("shape", (self.points.len(), 2))?;
+        interface.set_item("typestr", typestr)?;
+        interface.set_item("data", (self.points.as_ptr() as usize, true))?;
+        interface.set_item("version", 3)?;
+        Ok(interface)
+    }
+}
+
+/// Read-only view of one normalized coordinate axis of a `ScatterPlot`
+///
+/// `np.asarray(view)` is a zero-copy float32 view. The view shares ownership
+/// of the plot's data, so it stays valid even if the plot is given new data.
+#[pyclass(name = "CoordinateView")]
+struct PyCoordinateView {
+    data: Arc<ChartData>,
+    y: bool,
+}
+
+impl PyCoordinateView {
+    fn coords(&self) -> &[f32] {
+        if self.y { &self.data.ys } else { &self.data.xs }
+    }
+}
+
+#[pymethods]
+impl PyCoordinateView {
+    fn __len__(&self) -> usize {
+        self.coords().len()
+    }
+
+    /// NumPy array interface: a read-only `(n,)` float32 view of the coordinates
+    #[getter]
+    fn __array_interface__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, pyo3::types::PyDict>> {
+        let coords = self.coords();
+        let typestr = if cfg!(target_endian = "little") { "<f4" } else { ">f4" };
+        let interface = pyo3::types::PyDict::new_bound(py);
+        interface.set_item("shape", (coords.len(),))?;
+        interface.set_item("typestr", typestr)?;
+        interface.set_item("data", (coords.as_ptr() as usize, true))?;
+        interface.set_item("version", 3)?;
+        Ok(interface)
+    }
+}
 
 /// GPU-accelerated scatter plot renderer
 #[pyclass]
 pub struct PyScatterPlot {
-    chart_data: Option<ChartData>,
+    // Shared with any CoordinateView handed out; never mutated in place
+    chart_data: Option<Arc<ChartData>>,
     title: String,
 }
 
@@ -29,25 +182,43 @@ impl PyScatterPlot {
     /// 
     /// Opens a window and renders the scatter plot. This is a blocking call
     /// that runs until the window is closed.
-    fn show(&self) -> PyResult<()> {
+    fn show(&self, py: Python<'_>) -> PyResult<()> {
         let chart_data = self.chart_data.as_ref()
             .ok_or_else(|| pyo3::exceptions::PyValueError::new_err(
                 "No data set. Call scatter() with data first."
             ))?;
         
-        // Clone the data for the window (run_window takes ownership)
-        let data_clone = ChartData {
-            vertices: chart_data.vertices.clone(),
-            viewport_width: chart_data.viewport_width,
-            viewport_height: chart_data.viewport_height,
-        };
-        
-        run_window(data_clone, &self.title);
+        // The window borrows the data; points go straight from here into
+        // the GPU buffer without an intermediate copy. Upload and the event
+        // loop are pure Rust, so other Python threads keep running.
+        py.allow_threads(|| run_window(chart_data, &self.title));
         Ok(())
     }
     
+    /// Normalized x coordinates as uploaded to the GPU
+    /// 
+    /// `np.asarray(plot.xs)` is a read-only float32 view; nothing is copied.
+    #[getter]
+    fn xs(&self) -> PyResult<PyCoordinateView> {
+        self.view(false)
+    }
+    
+    /// Normalized y coordinates as uploaded to the GPU
+    /// 
+    /// `np.asarray(plot.ys)` is a read-only float32 view; nothing is copied.
+    #[getter]
+    fn ys(&self) -> PyResult<PyCoordinateView> {
+        self.view(true)
+    }
+    
     /// Create a scatter plot from numpy arrays
     /// 
+    /// Contiguous float32 arrays are read in place without copying. If x and y
+    /// have different lengths, only the first min(len(x), len(y)) points are used.
+    /// 
+    /// The arrays are read with the GIL released, so other threads must not
+    /// write to them (or to arrays sharing their memory) until this returns.
+    /// 
     /// Args:
     ///     x: NumPy array of x coordinates
     ///     y: NumPy array of y coordinates
@@ -63,9 +234,9 @@ impl PyScatterPlot {
     #[pyo3(signature = (x, y, color=None, size=None, width=800.0, height=600.0, x_range=None, y_range=None))]
     fn from_arrays(
         &mut self,
-        py: Python,
-        x: PyReadonlyArray1<f32>,
-        y: PyReadonlyArray1<f32>,
+        py: Python<'_>,
+        x: &Bound<'_, PyAny>,
+        y: &Bound<'_, PyAny>,
         color: Option<(f32, f32, f32, f32)>,
         size: Option<f32>,
         width: f32,
@@ -73,44 +244,54 @@ impl PyScatterPlot {
         x_range: Option<(f32, f32)>,
         y_range: Option<(f32, f32)>,
     ) -> PyResult<String> {
-        let x_slice = x.as_slice()?;
-        let y_slice = y.as_slice()?;
-        
-        // Warn if arrays have different lengths (core will use shorter length)
-        if x_slice.len() != y_slice.len() {
-            let min_len = x_slice.len().min(y_slice.len());
-            py.import_bound("warnings")?
-                .call_method1(
-                    "warn",
-                    (format!(
-                        "x and y arrays have different lengths ({} vs {}). Using {} points.",
-                        x_slice.len(), y_slice.len(), min_len
-                    ),)
-                )?;
-        }
+        let x = Coords::extract(x)?;
+        let y = Coords::extract(y)?;
         
         // Create color
         let color_opt = color.map(|(r, g, b, a)| Color { r, g, b, a });
         
-        // Create chart data with optional custom ranges
-        self.chart_data = Some(ChartData::from_scatter_with_range(
-            x_slice,
-            y_slice,
-            color_opt,
-            size,
-            width,
-            height,
-            x_range,
-            y_range,
-        ));
+        // Create chart data with optional custom ranges. float64 pairs take the
+        // fused cast + normalize path; anything else is normalized as float32.
+        // The slices are borrowed up front so the normalization itself runs
+        // with the GIL released. They still point into NumPy-owned memory, so
+        // callers must not mutate the inputs concurrently (see the docstring);
+        // the writeable flag cannot enforce this, since a read-only view may
+        // share memory with a writeable array.
+        let chart_data = match (&x, &y) {
+            (Coords::F64(x), Coords::F64(y)) => {
+                let (x, y) = (x.as_slice()?, y.as_slice()?);
+                py.allow_threads(|| ChartData::from_scatter_f64_with_range(
+                    x, y, color_opt, size, width, height, x_range, y_range,
+                ))
+            }
+            _ => {
+                let (mut x_scratch, mut y_scratch) = (Vec::new(), Vec::new());
+                let x = x.as_f32(&mut x_scratch)?;
+                let y = y.as_f32(&mut y_scratch)?;
+                py.allow_threads(|| ChartData::from_scatter_with_range(
+                    x, y, color_opt, size, width, height, x_range, y_range,
+                ))
+            }
+        };
+        self.chart_data = Some(Arc::new(chart_data));
         
         Ok(format!(
             "Scatter plot created with {} points. Call show() to display.",
-            x_slice.len()
+            x.len()
         ))
     }
 }
 
+impl PyScatterPlot {
+    fn view(&self, y: bool) -> PyResult<PyCoordinateView> {
+        let data = self.chart_data.as_ref()
+            .ok_or_else(|| pyo3::exceptions::PyValueError::new_err(
+                "No data set. Call scatter() with data first."
+            ))?;
+        Ok(PyCoordinateView { data: Arc::clone(data), y })
+    }
+}
+
 /// Create a scatter plot from Python lists or numpy arrays
 /// 
 /// Args:
@@ -123,6 +304,9 @@ impl PyScatterPlot {
 ///     x_range: Optional tuple (min, max) for custom x output range. Default is [-1.0, 1.0].
 ///     y_range: Optional tuple (min, max) for custom y output range. Default is [-1.0, 1.0].
 /// 
+/// The arrays are read with the GIL released, so other threads must not
+/// write to them (or to arrays sharing their memory) until this returns.
+/// 
 /// Returns:
 ///     PyScatterPlot object
 /// 
@@ -138,7 +322,6 @@ impl PyScatterPlot {
 #[pyfunction]
 #[pyo3(signature = (x, y, color=None, size=None, width=800.0, height=600.0, x_range=None, y_range=None))]
 fn scatter(
-    py: Python,
     x: &Bound<'_, PyAny>,
     y: &Bound<'_, PyAny>,
     color: Option<&Bound<'_, PyAny>>,
@@ -150,16 +333,6 @@ fn scatter(
 ) -> PyResult<PyScatterPlot> {
     let mut plot = PyScatterPlot::new();
     
-    // Convert inputs to float32 numpy arrays if they aren't already
-    // NumPy defaults to float64, but GPUs work best with float32
-    let np = py.import_bound("numpy")?;
-    let x_array: PyReadonlyArray1<f32> = np
-        .call_method1("asarray", (x, np.getattr("float32")?))?
-        .extract()?;
-    let y_array: PyReadonlyArray1<f32> = np
-        .call_method1("asarray", (y, np.getattr("float32")?))?
-        .extract()?;
-    
     // Parse color if provided
     let color_tuple = if let Some(c) = color {
         if let Ok(hex) = c.extract::<String>() {
@@ -178,10 +351,39 @@ fn scatter(
         None
     };
     
-    plot.from_arrays(py, x_array, y_array, color_tuple, size, width, height, x_range, y_range)?;
+    plot.from_arrays(x.py(), x, y, color_tuple, size, width, height, x_range, y_range)?;
     Ok(plot)
 }
 
+/// Smallest and largest value of an array in a single SIMD pass
+///
+/// NaN values are ignored, like `numpy.nanmin`/`numpy.nanmax`.
+///
+/// Args:
+///     a: List or NumPy array of numbers
+///
+/// Returns:
+///     Tuple (min, max)
+///
+/// Raises:
+///     ValueError: If the array is empty or only contains NaN
+#[pyfunction]
+fn minmax(a: &Bound<'_, PyAny>) -> PyResult<(f64, f64)> {
+    let (lo, hi) = match Coords::extract(a)? {
+        Coords::F32(array) => {
+            let (lo, hi) = min_max_f32(array.as_slice()?);
+            (lo as f64, hi as f64)
+        }
+        Coords::F64(array) => min_max_f64(array.as_slice()?),
+    };
+    if lo > hi {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "minmax() arg is empty or contains only NaN"
+        ));
+    }
+    Ok((lo, hi))
+}
+
 /// Helion Python bindings
 #[pymodule]
 fn _helion(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -189,11 +391,14 @@ fn _helion(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     
     // Classes from core (with python feature enabled)
     m.add_class::<Point2D>()?;
+    m.add_class::<PyPoint2DArray>()?;
+    m.add_class::<PyCoordinateView>()?;
     m.add_class::<Color>()?;
     m.add_class::<PyScatterPlot>()?;
     
     // Functions
     m.add_function(wrap_pyfunction!(scatter, m)?)?;
+    m.add_function(wrap_pyfunction!(minmax, m)?)?;
     
     Ok(())
 }
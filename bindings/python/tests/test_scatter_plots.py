@@ -10,54 +10,71 @@ import helion
 import numpy as np
 
 
+def _shared_xy(n):
+    # float32 exercises the zero-copy input path; read-only so tests sharing
+    # the arrays cannot modify them
+    rng = np.random.default_rng(0)
+    x = rng.random(n, dtype=np.float32)
+    y = rng.random(n, dtype=np.float32)
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+@pytest.fixture(scope="module")
+def xy_1k():
+    """1,000 float32 points shared by every test in this module"""
+    return _shared_xy(1000)
+
+
+@pytest.fixture(scope="module")
+def xy_1M():
+    """1,000,000 float32 points shared by every test in this module"""
+    return _shared_xy(1_000_000)
+
+
 class TestScatterPlotCreation:
     """Test scatter plot creation with various configurations"""
     
-    def test_basic_scatter_plot(self):
+    def test_basic_scatter_plot(self, xy_1k):
         """Test creating a basic scatter plot"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y)
         assert plot is not None
         assert isinstance(plot, helion.ScatterPlot)
     
-    def test_scatter_with_color_hex(self):
+    def test_scatter_with_color_hex(self, xy_1k):
         """Test scatter plot with hex color"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y, color="#FF5733")
         assert plot is not None
     
-    def test_scatter_with_color_rgb(self):
+    def test_scatter_with_color_rgb(self, xy_1k):
         """Test scatter plot with RGB tuple"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y, color=(1.0, 0.5, 0.3))
         assert plot is not None
     
-    def test_scatter_with_custom_size(self):
+    def test_scatter_with_custom_size(self, xy_1k):
         """Test scatter plot with custom point size"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y, size=5.0)
         assert plot is not None
     
-    def test_scatter_with_custom_dimensions(self):
+    def test_scatter_with_custom_dimensions(self, xy_1k):
         """Test scatter plot with custom viewport dimensions"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y, width=1200.0, height=800.0)
         assert plot is not None
     
-    def test_scatter_with_custom_ranges(self):
+    def test_scatter_with_custom_ranges(self, xy_1k):
         """Test scatter plot with custom coordinate ranges"""
-        x = np.random.rand(1000)
-        y = np.random.rand(1000)
+        x, y = xy_1k
         
         plot = helion.scatter(
             x, y,
@@ -66,10 +83,9 @@ class TestScatterPlotCreation:
         )
         assert plot is not None
     
-    def test_large_dataset(self):
+    def test_large_dataset(self, xy_1M):
         """Test scatter plot with 1 million points"""
-        x = np.random.rand(1_000_000)
-        y = np.random.rand(1_000_000)
+        x, y = xy_1M
         
         plot = helion.scatter(x, y)
         assert plot is not None
@@ -82,17 +98,79 @@ class TestScatterPlotCreation:
         # Should not raise an error
         plot = helion.scatter(x, y)
         assert plot is not None
-    
-    def test_mismatched_array_lengths(self):
+
+    def test_integer_and_strided_inputs(self):
+        """Test that non-float and non-contiguous inputs are converted"""
+        x = np.arange(2000)[::2]  # int64, strided
+        y = [float(i) for i in range(1000)]
+
+        plot = helion.scatter(x, y)
+        assert plot is not None
+
+    def test_cuda_array_interface_input(self, xy_1k):
+        """Test that arrays exposing __cuda_array_interface__ are copied to host"""
+        class FakeDeviceArray:
+            # Mimics CuPy: device memory plus a get() that returns a NumPy copy
+            def __init__(self, host):
+                self._host = host
+                self.__cuda_array_interface__ = {
+                    "shape": host.shape, "typestr": host.dtype.str, "data": (0, False), "version": 3,
+                }
+
+            def get(self):
+                return self._host
+
+        x = FakeDeviceArray(xy_1k[0])
+        y = FakeDeviceArray(xy_1k[1])
+
+        plot = helion.scatter(x, y)
+        assert plot is not None
+
+    def test_dlpack_input(self, xy_1k):
+        """Test that CPU DLPack tensors are accepted without copying"""
+        class FakeTensor:
+            # Mimics a CPU tensor from another framework: DLPack export only
+            def __init__(self, host):
+                self._host = host
+
+            def __dlpack__(self, **kwargs):
+                return self._host.__dlpack__(**kwargs)
+
+            def __dlpack_device__(self):
+                return self._host.__dlpack_device__()
+
+        # Writable copies: NumPy < 2.1 refuses to export read-only arrays
+        x, y = xy_1k[0].copy(), xy_1k[1].copy()
+        tx, ty = FakeTensor(x), FakeTensor(y)
+
+        # The CPU import path views the tensor's memory instead of copying it
+        assert np.shares_memory(np.from_dlpack(tx), x)
+        assert np.shares_memory(helion._as_coords(tx), x)
+
+        plot = helion.scatter(tx, ty)
+        assert plot is not None
+
+    def test_mismatched_array_lengths(self, xy_1k):
         """Test handling of mismatched x/y array lengths"""
-        x = np.random.rand(1000)
-        y = np.random.rand(500)
+        x, y = xy_1k
+        y = y[:500]
         
         # Should create plot but use shorter length
         with pytest.warns(UserWarning, match="different lengths"):
             plot = helion.scatter(x, y)
         assert plot is not None
 
+    def test_plot_coordinate_views(self, xy_1k):
+        """Test that the plot's normalized coordinates are exposed without copying"""
+        x, y = xy_1k
+        plot = helion.scatter(x, y)
+
+        xs, ys = np.asarray(plot.xs), np.asarray(plot.ys)
+        assert xs.dtype == np.float32 and xs.shape == ys.shape == (1000,)
+        assert not xs.flags.writeable
+        assert xs.min() == -1.0 and xs.max() == 1.0
+        assert np.shares_memory(xs, np.asarray(plot.xs))
+
 
 class TestColorClass:
     """Test the Color class functionality"""
@@ -131,14 +209,89 @@ class TestPoint2D:
         assert point.x == 1.5
         assert point.y == 2.5
 
+    def test_point2d_array_interface(self):
+        """Test viewing a Point2D as a NumPy array without copying"""
+        point = helion.Point2D(1.5, 2.5)
+        view = np.asarray(point)
+        assert view.dtype == np.float32
+        assert view.tolist() == [1.5, 2.5]
+        assert not view.flags.writeable
+
+    def test_point2d_array_from_arrays(self):
+        """Test building many points at once from coordinate arrays"""
+        xs = np.arange(100, dtype=np.float32)
+        ys = np.arange(100, dtype=np.float64) * 2
+
+        points = helion.Point2DArray.from_arrays(xs, ys)
+        assert len(points) == 100
+        assert points[-1].x == 99.0
+        assert points[-1].y == 198.0
+
+        view = np.asarray(points)
+        assert view.shape == (100, 2)
+        np.testing.assert_array_equal(view[:, 0], xs)
+        np.testing.assert_array_equal(view[:, 1], ys.astype(np.float32))
+
+    def test_point2d_array_mismatched_lengths(self):
+        """Test that Point2DArray rejects coordinate arrays of different lengths"""
+        with pytest.raises(ValueError, match="different lengths"):
+            helion.Point2DArray.from_arrays(np.zeros(3), np.zeros(4))
+
+
+class TestRandomPoints:
+    """Test the random_points data helper"""
+
+    def test_random_points_float32(self):
+        """Test that random_points returns float32 arrays by default"""
+        x, y = helion.random_points(1000, seed=0)
+        assert x.dtype == np.float32 and y.dtype == np.float32
+        assert x.shape == y.shape == (1000,)
+        assert not np.array_equal(x, y)
+
+    def test_random_points_seed_and_dtype(self):
+        """Test reproducibility and float64 output"""
+        x1, y1 = helion.random_points(100, dtype=np.float64, seed=7)
+        x2, y2 = helion.random_points(100, dtype=np.float64, seed=7)
+        assert x1.dtype == np.float64
+        np.testing.assert_array_equal(x1, x2)
+        np.testing.assert_array_equal(y1, y2)
+
+    def test_random_points_rejects_other_dtypes(self):
+        """Test that unsupported dtypes raise TypeError"""
+        with pytest.raises(TypeError):
+            helion.random_points(10, dtype=np.int32)
+
+
+class TestMinMax:
+    """Test the single-pass minmax helper"""
+
+    def test_minmax_matches_numpy(self, xy_1M):
+        """Test minmax against separate NumPy min/max calls"""
+        x, _ = xy_1M
+        assert helion.minmax(x) == (x.min(), x.max())
+        assert helion.minmax(x.astype(np.float64)) == (x.min(), x.max())
+
+    def test_minmax_ignores_nan(self):
+        """Test that NaN values are skipped"""
+        assert helion.minmax([3.0, float("nan"), -2.0]) == (-2.0, 3.0)
+
+    def test_minmax_integers_beyond_float32(self):
+        """Test that integer input keeps full precision above 2**24"""
+        a = np.array([16777217, 3, 2**40 + 1])
+        assert helion.minmax(a) == (3, 2**40 + 1)
+
+    def test_minmax_empty(self):
+        """Test that an empty array raises ValueError"""
+        with pytest.raises(ValueError):
+            helion.minmax(np.array([], dtype=np.float32))
+
 
 class TestPlotTitle:
     """Test plot title customization"""
     
-    def test_set_title(self):
+    def test_set_title(self, xy_1k):
         """Test setting custom window title"""
-        x = np.random.rand(100)
-        y = np.random.rand(100)
+        x, y = xy_1k
         
         plot = helion.scatter(x, y)
         plot.set_title("My Custom Plot")
@@ -156,10 +309,9 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="No data set"):
             plot.show()
     
-    def test_invalid_color_format(self):
+    def test_invalid_color_format(self, xy_1k):
         """Test that invalid color format raises error"""
-        x = np.random.rand(100)
-        y = np.random.rand(100)
+        x, y = xy_1k
         
         with pytest.raises(TypeError):
             plot = helion.scatter(x, y, color=12345)  # Invalid type
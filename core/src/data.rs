@@ -1,5 +1,9 @@
 use bytemuck::{Pod, Zeroable};
 
+use std::sync::atomic::{AtomicU64, Ordering};
+
+use crate::kernels;
+
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 
@@ -26,6 +30,20 @@ impl Point2D {
     fn py_new(x: f32, y: f32) -> Self {
         Self::new(x, y)
     }
+
+    /// NumPy array interface: a read-only float32 view of `(x, y)`
+    ///
+    /// `np.asarray(point)` shares this point's memory instead of copying.
+    #[getter]
+    fn __array_interface__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, pyo3::types::PyDict>> {
+        let typestr = if cfg!(target_endian = "little") { "<f4" } else { ">f4" };
+        let interface = pyo3::types::PyDict::new_bound(py);
+        interface.set_item("shape", (2,))?;
+        interface.set_item("typestr", typestr)?;
+        interface.set_item("data", (self as *const Self as usize, true))?;
+        interface.set_item("version", 3)?;
+        Ok(interface)
+    }
 }
 
 /// Color in RGBA format
@@ -44,8 +62,58 @@ impl Color {
         Self { r, g, b, a }
     }
 
+    /// Parse a `#RRGGBB` or `#RRGGBBAA` hex string (the `#` is optional)
+    ///
+    /// Well-formed 6- and 8-digit strings are decoded branch-free in one
+    /// `u64`; anything else goes through the per-pair parser, where an invalid
+    /// pair decodes as 0 (or 255 for alpha).
     pub fn from_hex(hex: &str) -> Self {
         let hex = hex.trim_start_matches('#');
+        Self::from_hex_swar(hex.as_bytes()).unwrap_or_else(|| Self::from_hex_pairs(hex))
+    }
+
+    /// SWAR decode of exactly 6 or 8 hex digits, one byte lane per digit
+    ///
+    /// Returns `None` if the length is wrong or any byte is not a hex digit.
+    fn from_hex_swar(digits: &[u8]) -> Option<Self> {
+        const ONES: u64 = 0x0101_0101_0101_0101;
+        const HIGH: u64 = 0x80 * ONES;
+
+        if digits.len() != 6 && digits.len() != 8 {
+            return None;
+        }
+        // A missing alpha pair decodes as FF
+        let mut bytes = *b"FFFFFFFF";
+        bytes[..digits.len()].copy_from_slice(digits);
+        let w = u64::from_le_bytes(bytes);
+
+        // High bit of each lane set iff lo <= byte <= hi (exact for ASCII lanes)
+        let in_range = |v: u64, lo: u8, hi: u8| {
+            let ge = v.wrapping_add((0x80 - lo as u64) * ONES);
+            let gt = v.wrapping_add((0x7F - hi as u64) * ONES);
+            ge & !gt & HIGH
+        };
+        let valid = in_range(w, b'0', b'9') | in_range(w | 0x20 * ONES, b'a', b'f');
+        if (w & HIGH) | (valid ^ HIGH) != 0 {
+            return None;
+        }
+
+        // '0'-'9' keep their low nibble; 'a'-'f'/'A'-'F' (bit 6 set) add 9
+        let nibbles = (w & 0x0F * ONES) + ((w & 0x40 * ONES) >> 6) * 9;
+        // Even lanes now hold the byte value of each digit pair
+        let pairs = (nibbles << 4) | (nibbles >> 8);
+        let channel = |i: u32| ((pairs >> (16 * i)) & 0xFF) as f32 / 255.0;
+
+        Some(Self {
+            r: channel(0),
+            g: channel(1),
+            b: channel(2),
+            a: channel(3),
+        })
+    }
+
+    /// Per-pair fallback for strings the SWAR path rejects
+    fn from_hex_pairs(hex: &str) -> Self {
         let r = u8::from_str_radix(&hex[0..2], 16).unwrap_or(0) as f32 / 255.0;
         let g = u8::from_str_radix(&hex[2..4], 16).unwrap_or(0) as f32 / 255.0;
         let b = u8::from_str_radix(&hex[4..6], 16).unwrap_or(0) as f32 / 255.0;
@@ -82,67 +150,63 @@ impl Default for Color {
     }
 }
 
-/// Vertex data for rendering (position + color + size)
+/// Per-plot style shared by every point, uploaded as a uniform buffer
+///
+/// Matches the `PointStyle` struct in the WGSL shaders (16-byte aligned).
+/// `size` is the point diameter in pixels; `viewport` is the render target
+/// size in pixels, used to turn that into clip-space units.
 #[repr(C)]
 #[derive(Debug, Clone, Copy, Pod, Zeroable)]
-pub struct Vertex {
-    pub position: [f32; 2],
+pub struct PointStyle {
     pub color: [f32; 4],
+    pub viewport: [f32; 2],
     pub size: f32,
-    pub _padding: [f32; 3], // Align to 16 bytes
+    pub _padding: f32, // Align to 16 bytes
 }
 
-impl Vertex {
-    pub fn new(position: Point2D, color: Color, size: f32) -> Self {
+impl PointStyle {
+    pub fn new(color: Color, size: f32, viewport: [f32; 2]) -> Self {
         Self {
-            position: [position.x, position.y],
             color: [color.r, color.g, color.b, color.a],
+            viewport,
             size,
-            _padding: [0.0; 3],
-        }
-    }
-
-    pub fn desc<'a>() -> wgpu::VertexBufferLayout<'a> {
-        wgpu::VertexBufferLayout {
-            array_stride: std::mem::size_of::<Vertex>() as wgpu::BufferAddress,
-            step_mode: wgpu::VertexStepMode::Vertex,
-            attributes: &[
-                // Position
-                wgpu::VertexAttribute {
-                    offset: 0,
-                    shader_location: 0,
-                    format: wgpu::VertexFormat::Float32x2,
-                },
-                // Color
-                wgpu::VertexAttribute {
-                    offset: std::mem::size_of::<[f32; 2]>() as wgpu::BufferAddress,
-                    shader_location: 1,
-                    format: wgpu::VertexFormat::Float32x4,
-                },
-                // Size
-                wgpu::VertexAttribute {
-                    offset: std::mem::size_of::<[f32; 6]>() as wgpu::BufferAddress,
-                    shader_location: 2,
-                    format: wgpu::VertexFormat::Float32,
-                },
-            ],
+            _padding: 0.0,
         }
     }
 }
 
 /// Chart data container
+///
+/// Points are stored structure-of-arrays: normalized x and y coordinates live
+/// in two separate `f32` arrays that are uploaded as-is to two GPU storage
+/// buffers and read by the vertex shader via `vertex_index`. Color and size
+/// apply to the whole plot and travel separately as a [`PointStyle`].
+///
+/// A generation counter records changes to the data. Each renderer remembers
+/// the generation it last uploaded and skips the upload on redraws while it
+/// is unchanged, so several renderers can draw the same data independently.
+/// [`ChartData::add_point`] bumps it; after modifying the public fields
+/// directly, call [`ChartData::mark_dirty`].
 pub struct ChartData {
-    pub vertices: Vec<Vertex>,
+    pub xs: Vec<f32>,
+    pub ys: Vec<f32>,
+    pub color: Color,
+    pub point_size: f32,
     pub viewport_width: f32,
     pub viewport_height: f32,
+    generation: AtomicU64,
 }
 
 impl ChartData {
     pub fn new(width: f32, height: f32) -> Self {
         Self {
-            vertices: Vec::new(),
+            xs: Vec::new(),
+            ys: Vec::new(),
+            color: Color::default(),
+            point_size: 2.0,
             viewport_width: width,
             viewport_height: height,
+            generation: AtomicU64::new(0),
         }
     }
 
@@ -150,15 +214,43 @@ impl ChartData {
     ///
     /// # Parameters
     /// * `point` - The 2D coordinates (x, y) of the point to add
-    /// * `color` - The RGBA color for this point (values 0.0-1.0)
-    /// * `size` - The size/radius of the point in pixels
-    pub fn add_point(&mut self, point: Point2D, color: Color, size: f32) {
-        self.vertices.push(Vertex::new(point, color, size));
+    pub fn add_point(&mut self, point: Point2D) {
+        self.xs.push(point.x);
+        self.ys.push(point.y);
+        self.mark_dirty();
+    }
+
+    /// Flag the data as changed so the next render re-uploads it
+    pub fn mark_dirty(&self) {
+        self.generation.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// Current generation of the data, bumped by every [`ChartData::mark_dirty`]
+    ///
+    /// Renderers compare it with the generation they last uploaded; reading
+    /// it does not consume anything, so other renderers are unaffected.
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
+    /// Number of points in the chart
+    pub fn len(&self) -> usize {
+        self.xs.len()
+    }
+
+    /// Whether the chart has no points
+    pub fn is_empty(&self) -> bool {
+        self.xs.is_empty()
+    }
+
+    /// Style uniform for the GPU
+    pub fn style(&self) -> PointStyle {
+        PointStyle::new(self.color, self.point_size, [self.viewport_width, self.viewport_height])
     }
 
     /// Create scatter plot data from raw arrays
     ///
-    /// Converts raw x and y coordinate arrays into normalized vertex data ready for GPU rendering.
+    /// Converts raw x and y coordinate arrays into normalized point data ready for GPU rendering.
     /// By default, normalizes coordinates to the [-1, 1] range required by GPU clip space.
     ///
     /// # Parameters
@@ -170,7 +262,7 @@ impl ChartData {
     /// * `height` - Viewport height in pixels
     ///
     /// # Returns
-    /// A new `ChartData` instance with normalized vertices ready for rendering
+    /// A new `ChartData` instance with normalized points ready for rendering
     pub fn from_scatter(
         x: &[f32],
         y: &[f32],
@@ -184,7 +276,7 @@ impl ChartData {
 
     /// Create scatter plot data with custom normalization ranges
     ///
-    /// Converts raw x and y coordinate arrays into normalized vertex data with user-specified
+    /// Converts raw x and y coordinate arrays into normalized point data with user-specified
     /// output ranges. This allows control over the coordinate mapping for custom viewports.
     ///
     /// # Parameters
@@ -198,7 +290,7 @@ impl ChartData {
     /// * `y_range` - Optional custom output range for y (min, max). If None, uses [-1.0, 1.0]
     ///
     /// # Returns
-    /// A new `ChartData` instance with normalized vertices
+    /// A new `ChartData` instance with normalized points
     ///
     /// # Example
     /// ```
@@ -224,33 +316,60 @@ impl ChartData {
         x_range: Option<(f32, f32)>,
         y_range: Option<(f32, f32)>,
     ) -> Self {
-        let mut data = Self::new(width, height);
-        let color = color.unwrap_or_default();
-        let size = size.unwrap_or(2.0);
-
-        // Default to GPU clip space [-1, 1] if not specified
-        let (x_out_min, x_out_max) = x_range.unwrap_or((-1.0, 1.0));
-        let (y_out_min, y_out_max) = y_range.unwrap_or((-1.0, 1.0));
-
-        // Find input data bounds
-        let x_min = x.iter().cloned().fold(f32::INFINITY, f32::min);
-        let x_max = x.iter().cloned().fold(f32::NEG_INFINITY, f32::max);
-        let y_min = y.iter().cloned().fold(f32::INFINITY, f32::min);
-        let y_max = y.iter().cloned().fold(f32::NEG_INFINITY, f32::max);
-
-        let x_in_range = x_max - x_min;
-        let y_in_range = y_max - y_min;
-        let x_out_range = x_out_max - x_out_min;
-        let y_out_range = y_out_max - y_out_min;
-
-        // Normalize coordinates to specified output range
-        for i in 0..x.len().min(y.len()) {
-            let norm_x = ((x[i] - x_min) / x_in_range) * x_out_range + x_out_min;
-            let norm_y = ((y[i] - y_min) / y_in_range) * y_out_range + y_out_min;
-            
-            data.add_point(Point2D::new(norm_x, norm_y), color, size);
-        }
+        let (x_min, x_max) = kernels::min_max_f32(x);
+        let (y_min, y_max) = kernels::min_max_f32(y);
+        let (x_from, x_to) = ((x_min as f64, x_max as f64), out_range(x_range));
+        let (y_from, y_to) = ((y_min as f64, y_max as f64), out_range(y_range));
+
+        let n = x.len().min(y.len());
+        let mut data = Self::styled(color, size, width, height);
+        data.xs = vec![0.0; n];
+        data.ys = vec![0.0; n];
+        kernels::map_f32(&x[..n], &mut data.xs, x_from, x_to);
+        kernels::map_f32(&y[..n], &mut data.ys, y_from, y_to);
+        data
+    }
+
+    /// Create scatter plot data from `f64` arrays with custom normalization ranges
+    ///
+    /// Same as [`ChartData::from_scatter_with_range`], but reads double precision
+    /// input directly: the cast to `f32` is fused with the range normalization,
+    /// so no intermediate `f32` copy of the input is made.
+    pub fn from_scatter_f64_with_range(
+        x: &[f64],
+        y: &[f64],
+        color: Option<Color>,
+        size: Option<f32>,
+        width: f32,
+        height: f32,
+        x_range: Option<(f32, f32)>,
+        y_range: Option<(f32, f32)>,
+    ) -> Self {
+        let (x_min, x_max) = kernels::min_max_f64(x);
+        let (y_min, y_max) = kernels::min_max_f64(y);
+        let (x_from, x_to) = ((x_min, x_max), out_range(x_range));
+        let (y_from, y_to) = ((y_min, y_max), out_range(y_range));
 
+        let n = x.len().min(y.len());
+        let mut data = Self::styled(color, size, width, height);
+        data.xs = vec![0.0; n];
+        data.ys = vec![0.0; n];
+        kernels::cast_and_map_f64_to_f32(&x[..n], &mut data.xs, x_from, x_to);
+        kernels::cast_and_map_f64_to_f32(&y[..n], &mut data.ys, y_from, y_to);
         data
     }
+
+    /// Empty chart with the given style; defaults are blue points of size 2.0
+    fn styled(color: Option<Color>, size: Option<f32>, width: f32, height: f32) -> Self {
+        let mut data = Self::new(width, height);
+        data.color = color.unwrap_or_default();
+        data.point_size = size.unwrap_or(2.0);
+        data
+    }
+}
+
+/// Output range for the kernels, defaulting to GPU clip space `[-1, 1]`
+fn out_range(range: Option<(f32, f32)>) -> (f64, f64) {
+    let (out_min, out_max) = range.unwrap_or((-1.0, 1.0));
+    (out_min as f64, out_max as f64)
 }
@@ -0,0 +1,314 @@
+//! CPU data-preparation kernels
+//!
+//! Hot loops that turn user coordinate arrays into GPU-ready `f32` data.
+//! Every kernel has a portable scalar implementation and, on x86_64, an
+//! AVX2 implementation that is selected at runtime. Large maps are also
+//! split across CPU cores with Rayon (native targets only).
+
+/// Element count at and above which the map kernels run on multiple cores
+///
+/// Below this the thread-pool handoff costs more than it saves.
+pub const PARALLEL_THRESHOLD: usize = 256 * 1024;
+
+/// Elements per Rayon task when a map kernel runs in parallel
+pub const PARALLEL_CHUNK: usize = 64 * 1024;
+
+/// Find the smallest and largest value in a single pass
+///
+/// NaN values are ignored, matching `f32::min`/`f32::max`. An empty slice
+/// (or one holding only NaN) returns `(f32::INFINITY, f32::NEG_INFINITY)`.
+pub fn min_max_f32(src: &[f32]) -> (f32, f32) {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            // SAFETY: CPU support was checked above
+            return unsafe { min_max_f32_avx2(src) };
+        }
+    }
+
+    src.iter()
+        .fold((f32::INFINITY, f32::NEG_INFINITY), |(lo, hi), &v| (lo.min(v), hi.max(v)))
+}
+
+/// Find the smallest and largest value in a single pass
+///
+/// `f64` counterpart of [`min_max_f32`].
+pub fn min_max_f64(src: &[f64]) -> (f64, f64) {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            // SAFETY: CPU support was checked above
+            return unsafe { min_max_f64_avx2(src) };
+        }
+    }
+
+    src.iter()
+        .fold((f64::INFINITY, f64::NEG_INFINITY), |(lo, hi), &v| (lo.min(v), hi.max(v)))
+}
+
+/// Weights of a range map, evaluated as `(hi - x) * a + (x - lo) * b`
+///
+/// This two-sided form puts both endpoints exactly on the output bounds: at
+/// `x == lo` (or `hi`) one term is exactly zero and the other is within one
+/// `f64` ulp of an `f32` bound, which rounds back to it. The one-sided
+/// `(x - lo) * scale + out_lo` leaves a residue at `hi` when `out_hi == 0`.
+#[derive(Clone, Copy)]
+struct RangeMap {
+    lo: f64,
+    hi: f64,
+    a: f64,
+    b: f64,
+}
+
+impl RangeMap {
+    fn new((lo, hi): (f64, f64), (out_lo, out_hi): (f64, f64)) -> Self {
+        let span = hi - lo;
+        Self { lo, hi, a: out_lo / span, b: out_hi / span }
+    }
+
+    #[inline]
+    fn apply(self, x: f64) -> f32 {
+        ((self.hi - x) * self.a + (x - self.lo) * self.b) as f32
+    }
+}
+
+/// Map `src` linearly from `from = (min, max)` onto `to = (out_min, out_max)`
+///
+/// The map is evaluated in `f64` and rounded once, so `min` and `max` land
+/// exactly on the requested output bounds.
+///
+/// # Panics
+/// Panics if `dst` is shorter than `src`.
+pub fn map_f32(src: &[f32], dst: &mut [f32], from: (f64, f64), to: (f64, f64)) {
+    let dst = &mut dst[..src.len()];
+
+    let map = RangeMap::new(from, to);
+
+    #[cfg(not(target_arch = "wasm32"))]
+    {
+        if src.len() >= PARALLEL_THRESHOLD {
+            use rayon::prelude::*;
+
+            dst.par_chunks_mut(PARALLEL_CHUNK)
+                .zip(src.par_chunks(PARALLEL_CHUNK))
+                .for_each(|(d, s)| map_f32_chunk(s, d, map));
+            return;
+        }
+    }
+
+    map_f32_chunk(src, dst, map);
+}
+
+/// Single-threaded body of [`map_f32`]; `dst` and `src` have equal length
+fn map_f32_chunk(src: &[f32], dst: &mut [f32], map: RangeMap) {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            // SAFETY: CPU support was checked above and both pointers cover `src.len()` elements
+            unsafe { map_f32_avx2(src.as_ptr(), dst.as_mut_ptr(), src.len(), map) };
+            return;
+        }
+    }
+
+    for (d, &s) in dst.iter_mut().zip(src) {
+        *d = map.apply(s as f64);
+    }
+}
+
+/// Map `src` like [`map_f32`], casting `f64` down to `f32`
+///
+/// The float64 → float32 conversion is fused with the range map, so every
+/// input element is read exactly once and no intermediate `f32` copy of the
+/// input is ever allocated. The map itself is evaluated in `f64`.
+///
+/// # Panics
+/// Panics if `dst` is shorter than `src`.
+pub fn cast_and_map_f64_to_f32(src: &[f64], dst: &mut [f32], from: (f64, f64), to: (f64, f64)) {
+    let dst = &mut dst[..src.len()];
+    let map = RangeMap::new(from, to);
+
+    #[cfg(not(target_arch = "wasm32"))]
+    {
+        if src.len() >= PARALLEL_THRESHOLD {
+            use rayon::prelude::*;
+
+            dst.par_chunks_mut(PARALLEL_CHUNK)
+                .zip(src.par_chunks(PARALLEL_CHUNK))
+                .for_each(|(d, s)| cast_and_map_chunk(s, d, map));
+            return;
+        }
+    }
+
+    cast_and_map_chunk(src, dst, map);
+}
+
+/// Single-threaded body of [`cast_and_map_f64_to_f32`]; `dst` and `src` have equal length
+fn cast_and_map_chunk(src: &[f64], dst: &mut [f32], map: RangeMap) {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if is_x86_feature_detected!("avx2") {
+            // SAFETY: CPU support was checked above and both pointers cover `src.len()` elements
+            unsafe { cast_and_map_f64_to_f32_avx2(src.as_ptr(), dst.as_mut_ptr(), src.len(), map) };
+            return;
+        }
+    }
+
+    for (d, &s) in dst.iter_mut().zip(src) {
+        *d = map.apply(s);
+    }
+}
+
+// ============================================================================
+// AVX2 implementations
+// ============================================================================
+
+// min/max: `_mm256_min_ps(v, acc)` returns its second operand when either is
+// NaN, so NaN lanes leave the accumulator unchanged. Four independent
+// accumulator pairs keep the loop bound by loads rather than min/max latency.
+
+/// 32 lanes per iteration in four 8×f32 accumulator pairs, reduced at the end
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn min_max_f32_avx2(src: &[f32]) -> (f32, f32) {
+    use std::arch::x86_64::*;
+
+    let (n, p) = (src.len(), src.as_ptr());
+    let mut lo = [_mm256_set1_ps(f32::INFINITY); 4];
+    let mut hi = [_mm256_set1_ps(f32::NEG_INFINITY); 4];
+
+    let mut i = 0;
+    while i + 32 <= n {
+        for k in 0..4 {
+            let v = _mm256_loadu_ps(p.add(i + 8 * k));
+            lo[k] = _mm256_min_ps(v, lo[k]);
+            hi[k] = _mm256_max_ps(v, hi[k]);
+        }
+        i += 32;
+    }
+    while i + 8 <= n {
+        let v = _mm256_loadu_ps(p.add(i));
+        lo[0] = _mm256_min_ps(v, lo[0]);
+        hi[0] = _mm256_max_ps(v, hi[0]);
+        i += 8;
+    }
+
+    // Horizontal reduce: combine the accumulator pairs, then the lanes
+    let mut lo_lanes = [0.0f32; 8];
+    let mut hi_lanes = [0.0f32; 8];
+    _mm256_storeu_ps(lo_lanes.as_mut_ptr(), _mm256_min_ps(_mm256_min_ps(lo[0], lo[1]), _mm256_min_ps(lo[2], lo[3])));
+    _mm256_storeu_ps(hi_lanes.as_mut_ptr(), _mm256_max_ps(_mm256_max_ps(hi[0], hi[1]), _mm256_max_ps(hi[2], hi[3])));
+
+    lo_lanes
+        .iter()
+        .zip(&hi_lanes)
+        .map(|(&lo, &hi)| (lo, hi))
+        .chain(src[i..].iter().map(|&v| (v, v)))
+        .fold((f32::INFINITY, f32::NEG_INFINITY), |(lo, hi), (l, h)| (lo.min(l), hi.max(h)))
+}
+
+/// 16 lanes per iteration in four 4×f64 accumulator pairs, reduced at the end
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn min_max_f64_avx2(src: &[f64]) -> (f64, f64) {
+    use std::arch::x86_64::*;
+
+    let (n, p) = (src.len(), src.as_ptr());
+    let mut lo = [_mm256_set1_pd(f64::INFINITY); 4];
+    let mut hi = [_mm256_set1_pd(f64::NEG_INFINITY); 4];
+
+    let mut i = 0;
+    while i + 16 <= n {
+        for k in 0..4 {
+            let v = _mm256_loadu_pd(p.add(i + 4 * k));
+            lo[k] = _mm256_min_pd(v, lo[k]);
+            hi[k] = _mm256_max_pd(v, hi[k]);
+        }
+        i += 16;
+    }
+    while i + 4 <= n {
+        let v = _mm256_loadu_pd(p.add(i));
+        lo[0] = _mm256_min_pd(v, lo[0]);
+        hi[0] = _mm256_max_pd(v, hi[0]);
+        i += 4;
+    }
+
+    // Horizontal reduce: combine the accumulator pairs, then the lanes
+    let mut lo_lanes = [0.0f64; 4];
+    let mut hi_lanes = [0.0f64; 4];
+    _mm256_storeu_pd(lo_lanes.as_mut_ptr(), _mm256_min_pd(_mm256_min_pd(lo[0], lo[1]), _mm256_min_pd(lo[2], lo[3])));
+    _mm256_storeu_pd(hi_lanes.as_mut_ptr(), _mm256_max_pd(_mm256_max_pd(hi[0], hi[1]), _mm256_max_pd(hi[2], hi[3])));
+
+    lo_lanes
+        .iter()
+        .zip(&hi_lanes)
+        .map(|(&lo, &hi)| (lo, hi))
+        .chain(src[i..].iter().map(|&v| (v, v)))
+        .fold((f64::INFINITY, f64::NEG_INFINITY), |(lo, hi), (l, h)| (lo.min(l), hi.max(h)))
+}
+
+// Range maps: the same two-sided `(hi - x) * a + (x - lo) * b` as
+// `RangeMap::apply`, with separate multiply and add (no FMA) so every lane
+// rounds exactly like the scalar path.
+
+/// Evaluate the range map on 4 f64 lanes and pack down to 4×f32
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn range_map_pd(v: std::arch::x86_64::__m256d, m: &[std::arch::x86_64::__m256d; 4]) -> std::arch::x86_64::__m128 {
+    use std::arch::x86_64::*;
+
+    let [lo, hi, a, b] = *m;
+    let mapped = _mm256_add_pd(
+        _mm256_mul_pd(_mm256_sub_pd(hi, v), a),
+        _mm256_mul_pd(_mm256_sub_pd(v, lo), b),
+    );
+    _mm256_cvtpd_ps(mapped)
+}
+
+/// Broadcast the range map weights as `[lo, hi, a, b]` vectors
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn range_map_splat(map: RangeMap) -> [std::arch::x86_64::__m256d; 4] {
+    use std::arch::x86_64::*;
+
+    [_mm256_set1_pd(map.lo), _mm256_set1_pd(map.hi), _mm256_set1_pd(map.a), _mm256_set1_pd(map.b)]
+}
+
+/// 4 lanes per iteration: load 4×f32, widen to f64, map, pack back
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn map_f32_avx2(src: *const f32, dst: *mut f32, n: usize, map: RangeMap) {
+    use std::arch::x86_64::*;
+
+    let m = range_map_splat(map);
+
+    let mut i = 0;
+    while i + 4 <= n {
+        let v = _mm256_cvtps_pd(_mm_loadu_ps(src.add(i)));
+        _mm_storeu_ps(dst.add(i), range_map_pd(v, &m));
+        i += 4;
+    }
+    while i < n {
+        *dst.add(i) = map.apply(*src.add(i) as f64);
+        i += 1;
+    }
+}
+
+/// 4 lanes per iteration: load 4×f64, map, pack down to 4×f32
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn cast_and_map_f64_to_f32_avx2(src: *const f64, dst: *mut f32, n: usize, map: RangeMap) {
+    use std::arch::x86_64::*;
+
+    let m = range_map_splat(map);
+
+    let mut i = 0;
+    while i + 4 <= n {
+        let v = _mm256_loadu_pd(src.add(i));
+        _mm_storeu_ps(dst.add(i), range_map_pd(v, &m));
+        i += 4;
+    }
+    while i < n {
+        *dst.add(i) = map.apply(*src.add(i));
+        i += 1;
+    }
+}
@@ -1,5 +1,7 @@
 pub mod backend;
 pub mod data;
+pub mod kernels;
+pub mod pool;
 pub mod renderer;
 pub mod scatter;
 pub mod shaders;
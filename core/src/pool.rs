@@ -0,0 +1,72 @@
+//! GPU buffer pooling
+//!
+//! Re-uploading chart data would otherwise create and destroy a pair of
+//! coordinate buffers every time. The pool keeps released buffers on
+//! free-lists keyed by size bucket and usage, so an upload of roughly the
+//! same size reuses an existing allocation instead of hitting the wgpu
+//! allocator.
+//!
+//! Buffers belong to the device that created them, so a pool is owned by a
+//! renderer (one device) rather than shared process-wide.
+
+use std::collections::HashMap;
+
+/// Granularity of pooled buffer sizes in bytes
+pub const BUCKET_SIZE: u64 = 64 * 1024;
+
+/// Free buffers kept per (size, usage) bucket; extras are dropped on release
+pub const MAX_FREE_PER_BUCKET: usize = 4;
+
+/// Round `size` up to the next multiple of [`BUCKET_SIZE`] (at least one bucket)
+pub fn bucket_size(size: u64) -> u64 {
+    size.max(1).div_ceil(BUCKET_SIZE) * BUCKET_SIZE
+}
+
+/// Free-lists of released buffers for a single device
+#[derive(Default)]
+pub struct BufferPool {
+    free: HashMap<(u64, u32), Vec<wgpu::Buffer>>,
+}
+
+impl BufferPool {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Take a released buffer that can hold `size` bytes with exactly `usage`
+    ///
+    /// Returns `None` when nothing suitable is free; the caller should then
+    /// create a buffer of [`bucket_size`]`(size)` bytes so it can be pooled
+    /// later. The contents of a reused buffer are whatever was last written.
+    pub fn take(&mut self, size: u64, usage: wgpu::BufferUsages) -> Option<wgpu::Buffer> {
+        self.free
+            .get_mut(&(bucket_size(size), usage.bits()))
+            .and_then(Vec::pop)
+    }
+
+    /// Return a buffer to the pool for later reuse
+    ///
+    /// Buffers whose size is not a whole bucket are dropped, as are buffers
+    /// beyond [`MAX_FREE_PER_BUCKET`] for their bucket.
+    pub fn release(&mut self, buffer: wgpu::Buffer) {
+        let size = buffer.size();
+        if size != bucket_size(size) {
+            return;
+        }
+
+        let list = self.free.entry((size, buffer.usage().bits())).or_default();
+        if list.len() < MAX_FREE_PER_BUCKET {
+            list.push(buffer);
+        }
+    }
+
+    /// Number of free buffers currently held
+    pub fn len(&self) -> usize {
+        self.free.values().map(Vec::len).sum()
+    }
+
+    /// Whether the pool holds no free buffers
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+}
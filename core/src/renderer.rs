@@ -41,14 +41,15 @@ pub trait WindowRenderer: Renderer {
     /// Create a new renderer for window context
     fn new(
         device: &wgpu::Device,
+        queue: &wgpu::Queue,
         config: &wgpu::SurfaceConfiguration,
-        chart_data: crate::data::ChartData,
+        chart_data: &crate::data::ChartData,
     ) -> Self
     where
         Self: Sized;
 
     /// Update the chart data
-    fn update_data(&mut self, device: &wgpu::Device, chart_data: &crate::data::ChartData);
+    fn update_data(&mut self, device: &wgpu::Device, queue: &wgpu::Queue, chart_data: &crate::data::ChartData);
 }
 
 /// WebRenderer trait - specialized for web/WASM contexts
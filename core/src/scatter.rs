@@ -1,8 +1,10 @@
-use crate::data::{ChartData, Vertex};
+use crate::data::{ChartData, PointStyle};
 use crate::renderer::{Renderer, WindowRenderer, WebRenderer, RenderOptions};
 use crate::backend::GPUBackend;
-use crate::shaders::{SIMPLE_VERTEX_SHADER, SIMPLE_FRAGMENT_SHADER};
-use wgpu::util::DeviceExt;
+use crate::pool::{self, BufferPool};
+use crate::shaders::{specialize, PointShape, SIMPLE_VERTEX_SHADER, SIMPLE_FRAGMENT_SHADER};
+use std::collections::HashMap;
+use std::sync::Arc;
 
 /// Scatter plot renderer - implements both WindowRenderer and WebRenderer traits
 /// 
@@ -15,77 +17,177 @@ use wgpu::util::DeviceExt;
 /// - Context-agnostic core: Same rendering logic for all platforms
 /// - Resource encapsulation: Manages its own GPU resources
 pub struct ScatterRenderer {
-    render_pipeline: wgpu::RenderPipeline,
-    vertex_buffer: Option<wgpu::Buffer>,
-    vertex_count: u32,
+    render_pipeline: Arc<wgpu::RenderPipeline>,
+    shape: PointShape,
+    format: wgpu::TextureFormat,
+    pipelines: HashMap<PipelineKey, Arc<wgpu::RenderPipeline>>,
+    bind_group_layout: wgpu::BindGroupLayout,
+    style_buffer: wgpu::Buffer,
+    viewport: Option<[f32; 2]>,
+    points: Option<PointBuffers>,
+    uploaded_generation: Option<u64>,
+    pool: BufferPool,
+    staging: wgpu::util::StagingBelt,
+}
+
+/// Identifies one specialized render pipeline
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+struct PipelineKey {
+    shape: PointShape,
+    format: wgpu::TextureFormat,
+}
+
+/// Usage of the coordinate buffers: read by the vertex shader, rewritten in
+/// place when a pooled buffer is reused
+const COORD_USAGE: wgpu::BufferUsages =
+    wgpu::BufferUsages::STORAGE.union(wgpu::BufferUsages::COPY_DST);
+
+/// Points per staging chunk when rewriting a pooled coordinate buffer
+const UPLOAD_CHUNK_POINTS: usize = 64 * 1024;
+
+/// GPU copies of the x and y coordinate arrays, bound for vertex pulling
+///
+/// The buffers come from the renderer's [`BufferPool`] and may be larger
+/// than the data; the bind group only exposes the first `count` elements.
+struct PointBuffers {
+    xs: wgpu::Buffer,
+    ys: wgpu::Buffer,
+    bind_group: wgpu::BindGroup,
+    count: u32,
 }
 
 // ============================================================================
-// Base Renderer Implementation - Common to all contexts
+// Buffer upload helpers
 // ============================================================================
 
-impl Renderer for ScatterRenderer {
-    fn render_to_pass<'rpass>(&'rpass mut self, render_pass: &mut wgpu::RenderPass<'rpass>) {
-        render_pass.set_pipeline(&self.render_pipeline);
-        
-        if let Some(ref buffer) = self.vertex_buffer {
-            render_pass.set_vertex_buffer(0, buffer.slice(..));
-            render_pass.draw(0..self.vertex_count, 0..1);
-        }
-    }
+/// Create a buffer and fill it through its mapped-at-creation range
+///
+/// `fill` writes straight into the mapped staging memory, so upload data does
+/// not have to be assembled in an intermediate CPU buffer first.
+/// `size` must be a multiple of `wgpu::COPY_BUFFER_ALIGNMENT`.
+fn create_mapped_buffer(
+    device: &wgpu::Device,
+    label: &str,
+    size: wgpu::BufferAddress,
+    usage: wgpu::BufferUsages,
+    fill: impl FnOnce(&mut [u8]),
+) -> wgpu::Buffer {
+    let buffer = device.create_buffer(&wgpu::BufferDescriptor {
+        label: Some(label),
+        size,
+        usage,
+        mapped_at_creation: true,
+    });
+    fill(&mut buffer.slice(..).get_mapped_range_mut());
+    buffer.unmap();
+    buffer
+}
+
+/// Upload plain-old-data into a new buffer via [`create_mapped_buffer`]
+fn create_pod_buffer<T: bytemuck::Pod>(
+    device: &wgpu::Device,
+    label: &str,
+    contents: &[T],
+    usage: wgpu::BufferUsages,
+) -> wgpu::Buffer {
+    let bytes: &[u8] = bytemuck::cast_slice(contents);
+    create_mapped_buffer(device, label, bytes.len() as wgpu::BufferAddress, usage, |dst| {
+        dst.copy_from_slice(bytes)
+    })
 }
 
 // ============================================================================
-// WindowRenderer Implementation - For native window contexts
+// Shared setup - pipeline, style uniform and point storage
 // ============================================================================
 
-impl WindowRenderer for ScatterRenderer {
-    /// Create a new scatter renderer for window context
-    fn new(
+/// Layout entry for a read-only storage buffer visible to the vertex stage
+fn vertex_storage_entry(binding: u32) -> wgpu::BindGroupLayoutEntry {
+    wgpu::BindGroupLayoutEntry {
+        binding,
+        visibility: wgpu::ShaderStages::VERTEX,
+        ty: wgpu::BindingType::Buffer {
+            ty: wgpu::BufferBindingType::Storage { read_only: true },
+            has_dynamic_offset: false,
+            min_binding_size: None,
+        },
+        count: None,
+    }
+}
+
+impl ScatterRenderer {
+    /// Build the bind group layout for style + coordinates, shared by every pipeline
+    fn create_bind_group_layout(device: &wgpu::Device) -> wgpu::BindGroupLayout {
+        // Style uniform (color + size) shared by every point, followed by the
+        // x and y storage arrays the vertex shader indexes by point
+        device.create_bind_group_layout(&wgpu::BindGroupLayoutDescriptor {
+            label: Some("Scatter Bind Group Layout"),
+            entries: &[
+                wgpu::BindGroupLayoutEntry {
+                    binding: 0,
+                    visibility: wgpu::ShaderStages::VERTEX,
+                    ty: wgpu::BindingType::Buffer {
+                        ty: wgpu::BufferBindingType::Uniform,
+                        has_dynamic_offset: false,
+                        min_binding_size: None,
+                    },
+                    count: None,
+                },
+                vertex_storage_entry(1),
+                vertex_storage_entry(2),
+            ],
+        })
+    }
+
+    /// Build the render pipeline specialized for `key`
+    fn create_pipeline(
         device: &wgpu::Device,
-        config: &wgpu::SurfaceConfiguration,
-        chart_data: ChartData,
-    ) -> Self {
-        // Create shader modules
+        bind_group_layout: &wgpu::BindGroupLayout,
+        key: PipelineKey,
+    ) -> wgpu::RenderPipeline {
+        // Create shader modules with only the code this point shape needs
         let vertex_shader = device.create_shader_module(wgpu::ShaderModuleDescriptor {
             label: Some("Scatter Vertex Shader"),
-            source: wgpu::ShaderSource::Wgsl(SIMPLE_VERTEX_SHADER.into()),
+            source: wgpu::ShaderSource::Wgsl(specialize(SIMPLE_VERTEX_SHADER, key.shape).into()),
         });
 
         let fragment_shader = device.create_shader_module(wgpu::ShaderModuleDescriptor {
             label: Some("Scatter Fragment Shader"),
-            source: wgpu::ShaderSource::Wgsl(SIMPLE_FRAGMENT_SHADER.into()),
+            source: wgpu::ShaderSource::Wgsl(specialize(SIMPLE_FRAGMENT_SHADER, key.shape).into()),
         });
 
         // Create pipeline layout
         let pipeline_layout = device.create_pipeline_layout(&wgpu::PipelineLayoutDescriptor {
             label: Some("Scatter Pipeline Layout"),
-            bind_group_layouts: &[],
+            bind_group_layouts: &[bind_group_layout],
             push_constant_ranges: &[],
         });
 
-        // Create render pipeline with the surface's texture format
+        // Create render pipeline with the target texture format
         let render_pipeline = device.create_render_pipeline(&wgpu::RenderPipelineDescriptor {
             label: Some("Scatter Render Pipeline"),
             layout: Some(&pipeline_layout),
             vertex: wgpu::VertexState {
                 module: &vertex_shader,
                 entry_point: "vs_main",
-                buffers: &[Vertex::desc()],
+                // No vertex buffers: positions are pulled from storage
+                buffers: &[],
                 compilation_options: Default::default(),
             },
             fragment: Some(wgpu::FragmentState {
                 module: &fragment_shader,
                 entry_point: "fs_main",
                 targets: &[Some(wgpu::ColorTargetState {
-                    format: config.format,  // Use surface format
+                    format: key.format,
                     blend: Some(wgpu::BlendState::ALPHA_BLENDING),
                     write_mask: wgpu::ColorWrites::ALL,
                 })],
                 compilation_options: Default::default(),
             }),
             primitive: wgpu::PrimitiveState {
-                topology: wgpu::PrimitiveTopology::PointList,
+                topology: match key.shape {
+                    PointShape::Pixel => wgpu::PrimitiveTopology::PointList,
+                    PointShape::Quad => wgpu::PrimitiveTopology::TriangleList,
+                },
                 strip_index_format: None,
                 front_face: wgpu::FrontFace::Ccw,
                 cull_mode: None,
@@ -103,43 +205,217 @@ impl WindowRenderer for ScatterRenderer {
             cache: None,
         });
 
-        // Create vertex buffer with initial data
-        let vertices = &chart_data.vertices;
-        let vertex_buffer = if !vertices.is_empty() {
-            Some(device.create_buffer_init(&wgpu::util::BufferInitDescriptor {
-                label: Some("Scatter Vertex Buffer"),
-                contents: bytemuck::cast_slice(&vertices),
-                usage: wgpu::BufferUsages::VERTEX,
-            }))
-        } else {
-            None
-        };
+        render_pipeline
+    }
+
+    /// Switch to the pipeline for `shape`, compiling it on first use
+    fn use_shape(&mut self, device: &wgpu::Device, shape: PointShape) {
+        let key = PipelineKey { shape, format: self.format };
+        let layout = &self.bind_group_layout;
+        let pipeline = self
+            .pipelines
+            .entry(key)
+            .or_insert_with(|| Arc::new(Self::create_pipeline(device, layout, key)));
+        self.render_pipeline = Arc::clone(pipeline);
+        self.shape = shape;
+    }
+
+    /// Create the style uniform buffer
+    fn create_style(device: &wgpu::Device, style: &PointStyle) -> wgpu::Buffer {
+        create_pod_buffer(
+            device,
+            "Scatter Style Buffer",
+            std::slice::from_ref(style),
+            wgpu::BufferUsages::UNIFORM | wgpu::BufferUsages::COPY_DST,
+        )
+    }
+
+    /// Create a renderer with no points for the given target format
+    fn with_format(device: &wgpu::Device, format: wgpu::TextureFormat) -> Self {
+        let style = ChartData::new(0.0, 0.0).style();
+        let bind_group_layout = Self::create_bind_group_layout(device);
+        let key = PipelineKey { shape: PointShape::for_size(style.size), format };
+        let render_pipeline = Arc::new(Self::create_pipeline(device, &bind_group_layout, key));
+        let style_buffer = Self::create_style(device, &style);
 
         ScatterRenderer {
-            render_pipeline,
-            vertex_buffer,
-            vertex_count: vertices.len() as u32,
+            render_pipeline: Arc::clone(&render_pipeline),
+            shape: key.shape,
+            format,
+            pipelines: HashMap::from([(key, render_pipeline)]),
+            bind_group_layout,
+            style_buffer,
+            viewport: None,
+            points: None,
+            uploaded_generation: None,
+            pool: BufferPool::new(),
+            staging: wgpu::util::StagingBelt::new(
+                (UPLOAD_CHUNK_POINTS * std::mem::size_of::<f32>()) as wgpu::BufferAddress,
+            ),
         }
     }
 
-    /// Update the vertex data
-    fn update_data(&mut self, device: &wgpu::Device, chart_data: &ChartData) {
-        let vertices = &chart_data.vertices;
+    /// Point the style uniform at a new render target size
+    ///
+    /// Keeps point sizes in pixels after the surface is resized. Only the
+    /// `viewport` field of the uniform is rewritten.
+    pub fn set_viewport(&mut self, queue: &wgpu::Queue, width: f32, height: f32) {
+        self.viewport = Some([width, height]);
+        queue.write_buffer(
+            &self.style_buffer,
+            std::mem::offset_of!(PointStyle, viewport) as wgpu::BufferAddress,
+            bytemuck::cast_slice(&[width, height]),
+        );
+    }
+
+    /// Copy `data` into a pooled coordinate buffer
+    ///
+    /// A free buffer of the right bucket is rewritten in chunks of
+    /// [`UPLOAD_CHUNK_POINTS`] through the staging belt, with the copies
+    /// recorded into `encoder`; otherwise a new bucket-sized buffer is
+    /// filled at creation.
+    fn upload_coords(
+        &mut self,
+        device: &wgpu::Device,
+        encoder: &mut wgpu::CommandEncoder,
+        label: &str,
+        data: &[f32],
+    ) -> wgpu::Buffer {
+        let bytes: &[u8] = bytemuck::cast_slice(data);
+        let size = bytes.len() as wgpu::BufferAddress;
+
+        match self.pool.take(size, COORD_USAGE) {
+            Some(buffer) => {
+                let chunk_bytes = UPLOAD_CHUNK_POINTS * std::mem::size_of::<f32>();
+                for (i, chunk) in bytes.chunks(chunk_bytes).enumerate() {
+                    let offset = (i * chunk_bytes) as wgpu::BufferAddress;
+                    let chunk_size = wgpu::BufferSize::new(chunk.len() as u64)
+                        .expect("chunks are never empty");
+                    self.staging
+                        .write_buffer(encoder, &buffer, offset, chunk_size, device)
+                        .copy_from_slice(chunk);
+                }
+                buffer
+            }
+            None => create_mapped_buffer(device, label, pool::bucket_size(size), COORD_USAGE, |dst| {
+                dst[..bytes.len()].copy_from_slice(bytes)
+            }),
+        }
+    }
+
+    /// Replace the coordinate buffers and style uniform with `chart_data`
+    ///
+    /// The previous coordinate buffers go back to the pool first, so
+    /// re-uploading data of a similar size reuses them. Empty data leaves no
+    /// buffers bound, since zero-sized storage bindings are not allowed.
+    fn upload(&mut self, device: &wgpu::Device, queue: &wgpu::Queue, chart_data: &ChartData) {
+        let mut style = chart_data.style();
+        if let Some(viewport) = self.viewport {
+            style.viewport = viewport;
+        }
+        queue.write_buffer(&self.style_buffer, 0, bytemuck::bytes_of(&style));
+        self.use_shape(device, PointShape::for_size(style.size));
+
+        if let Some(old) = self.points.take() {
+            self.pool.release(old.xs);
+            self.pool.release(old.ys);
+        }
+
+        if chart_data.is_empty() {
+            return;
+        }
+
+        // All staging copies for both axes go out in a single submit
+        let mut encoder = device.create_command_encoder(&wgpu::CommandEncoderDescriptor {
+            label: Some("Scatter Upload Encoder"),
+        });
+        let xs = self.upload_coords(device, &mut encoder, "Scatter X Buffer", &chart_data.xs);
+        let ys = self.upload_coords(device, &mut encoder, "Scatter Y Buffer", &chart_data.ys);
+        self.staging.finish();
+        queue.submit(std::iter::once(encoder.finish()));
+        self.staging.recall();
+
+        let binding_size = wgpu::BufferSize::new(std::mem::size_of_val(chart_data.xs.as_slice()) as u64);
+        let bind_group = device.create_bind_group(&wgpu::BindGroupDescriptor {
+            label: Some("Scatter Bind Group"),
+            layout: &self.bind_group_layout,
+            entries: &[
+                wgpu::BindGroupEntry {
+                    binding: 0,
+                    resource: self.style_buffer.as_entire_binding(),
+                },
+                wgpu::BindGroupEntry {
+                    binding: 1,
+                    resource: wgpu::BindingResource::Buffer(wgpu::BufferBinding {
+                        buffer: &xs,
+                        offset: 0,
+                        size: binding_size,
+                    }),
+                },
+                wgpu::BindGroupEntry {
+                    binding: 2,
+                    resource: wgpu::BindingResource::Buffer(wgpu::BufferBinding {
+                        buffer: &ys,
+                        offset: 0,
+                        size: binding_size,
+                    }),
+                },
+            ],
+        });
+
+        self.points = Some(PointBuffers {
+            xs,
+            ys,
+            bind_group,
+            count: chart_data.len() as u32,
+        });
+    }
+}
+
+// ============================================================================
+// Base Renderer Implementation - Common to all contexts
+// ============================================================================
+
+impl Renderer for ScatterRenderer {
+    fn render_to_pass<'rpass>(&'rpass mut self, render_pass: &mut wgpu::RenderPass<'rpass>) {
+        render_pass.set_pipeline(&self.render_pipeline);
         
-        if !vertices.is_empty() {
-            self.vertex_buffer = Some(device.create_buffer_init(&wgpu::util::BufferInitDescriptor {
-                label: Some("Scatter Vertex Buffer"),
-                contents: bytemuck::cast_slice(&vertices),
-                usage: wgpu::BufferUsages::VERTEX,
-            }));
-            self.vertex_count = vertices.len() as u32;
-        } else {
-            self.vertex_buffer = None;
-            self.vertex_count = 0;
+        // The shader fetches each point's coordinates by index: one vertex
+        // per point for pixels, one 6-vertex quad instance per point otherwise
+        if let Some(ref points) = self.points {
+            render_pass.set_bind_group(0, &points.bind_group, &[]);
+            match self.shape {
+                PointShape::Pixel => render_pass.draw(0..points.count, 0..1),
+                PointShape::Quad => render_pass.draw(0..6, 0..points.count),
+            }
         }
     }
 }
 
+// ============================================================================
+// WindowRenderer Implementation - For native window contexts
+// ============================================================================
+
+impl WindowRenderer for ScatterRenderer {
+    /// Create a new scatter renderer for window context
+    fn new(
+        device: &wgpu::Device,
+        queue: &wgpu::Queue,
+        config: &wgpu::SurfaceConfiguration,
+        chart_data: &ChartData,
+    ) -> Self {
+        // Use the surface's texture format
+        let mut renderer = Self::with_format(device, config.format);
+        renderer.upload(device, queue, chart_data);
+        renderer
+    }
+
+    /// Update the point data, reusing pooled buffers where possible
+    fn update_data(&mut self, device: &wgpu::Device, queue: &wgpu::Queue, chart_data: &ChartData) {
+        self.upload(device, queue, chart_data);
+    }
+}
+
 // ============================================================================
 // WebRenderer Implementation - For web/WASM contexts
 // ============================================================================
@@ -150,65 +426,7 @@ impl WebRenderer for ScatterRenderer {
         let config = backend.config.as_ref().ok_or("Backend not configured")?;
         
         // Reuse the same initialization logic
-        let vertex_shader = device.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("Scatter Vertex Shader"),
-            source: wgpu::ShaderSource::Wgsl(SIMPLE_VERTEX_SHADER.into()),
-        });
-
-        let fragment_shader = device.create_shader_module(wgpu::ShaderModuleDescriptor {
-            label: Some("Scatter Fragment Shader"),
-            source: wgpu::ShaderSource::Wgsl(SIMPLE_FRAGMENT_SHADER.into()),
-        });
-
-        let pipeline_layout = device.create_pipeline_layout(&wgpu::PipelineLayoutDescriptor {
-            label: Some("Scatter Pipeline Layout"),
-            bind_group_layouts: &[],
-            push_constant_ranges: &[],
-        });
-
-        let render_pipeline = device.create_render_pipeline(&wgpu::RenderPipelineDescriptor {
-            label: Some("Scatter Render Pipeline"),
-            layout: Some(&pipeline_layout),
-            vertex: wgpu::VertexState {
-                module: &vertex_shader,
-                entry_point: "vs_main",
-                buffers: &[Vertex::desc()],
-                compilation_options: Default::default(),
-            },
-            fragment: Some(wgpu::FragmentState {
-                module: &fragment_shader,
-                entry_point: "fs_main",
-                targets: &[Some(wgpu::ColorTargetState {
-                    format: config.format,
-                    blend: Some(wgpu::BlendState::ALPHA_BLENDING),
-                    write_mask: wgpu::ColorWrites::ALL,
-                })],
-                compilation_options: Default::default(),
-            }),
-            primitive: wgpu::PrimitiveState {
-                topology: wgpu::PrimitiveTopology::PointList,
-                strip_index_format: None,
-                front_face: wgpu::FrontFace::Ccw,
-                cull_mode: None,
-                polygon_mode: wgpu::PolygonMode::Fill,
-                unclipped_depth: false,
-                conservative: false,
-            },
-            depth_stencil: None,
-            multisample: wgpu::MultisampleState {
-                count: 1,
-                mask: !0,
-                alpha_to_coverage_enabled: false,
-            },
-            multiview: None,
-            cache: None,
-        });
-
-        Ok(ScatterRenderer {
-            render_pipeline,
-            vertex_buffer: None,
-            vertex_count: 0,
-        })
+        Ok(Self::with_format(device, config.format))
     }
 
     fn render_with_backend(
@@ -217,8 +435,13 @@ impl WebRenderer for ScatterRenderer {
         data: &ChartData,
         options: &RenderOptions,
     ) -> Result<(), String> {
-        // Update vertex buffer if data changed
-        <Self as WebRenderer>::update_data(self, backend, data)?;
+        // Re-upload only when the data changed since this renderer last
+        // uploaded it (or it has never seen it); redraws reuse the GPU buffers
+        let generation = data.generation();
+        if self.uploaded_generation != Some(generation) {
+            <Self as WebRenderer>::update_data(self, backend, data)?;
+            self.uploaded_generation = Some(generation);
+        }
 
         let device = backend.device()?;
         let queue = backend.queue()?;
@@ -266,19 +489,15 @@ impl WebRenderer for ScatterRenderer {
     }
 
     fn update_data(&mut self, backend: &GPUBackend, data: &ChartData) -> Result<(), String> {
-        if data.vertices.is_empty() {
+        if data.is_empty() {
             return Ok(());
         }
 
         let device = backend.device()?;
+        let queue = backend.queue()?;
 
-        // Create or update vertex buffer
-        self.vertex_buffer = Some(device.create_buffer_init(&wgpu::util::BufferInitDescriptor {
-            label: Some("Vertex Buffer"),
-            contents: bytemuck::cast_slice(&data.vertices),
-            usage: wgpu::BufferUsages::VERTEX | wgpu::BufferUsages::COPY_DST,
-        }));
-        self.vertex_count = data.vertices.len() as u32;
+        // Create or update coordinate buffers
+        self.upload(device, queue, data);
 
         Ok(())
     }
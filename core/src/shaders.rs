@@ -4,7 +4,7 @@
 // The GPU rendering pipeline has several stages:
 //
 // 1. VERTEX SHADER (runs once per vertex/point)
-//    - Input: Raw vertex data (position, color, size) from CPU
+//    - Input: Point coordinates and a per-plot style uniform from CPU
 //    - Process: Transform coordinates to GPU clip space [-1, 1]
 //    - Output: Transformed vertices passed to next stage
 //
@@ -19,9 +19,11 @@
 //    - Output: RGBA color written to render target (canvas)
 //
 // For scatter plots:
-// - We send vertex positions as points (not triangles)
-// - Each point becomes one or more pixels on screen
-// - Fragment shader can create circular shapes from square pixels
+// - Points of 1 pixel are drawn as a point list, one vertex per point
+// - Larger points are one instance of a 6-vertex quad (two triangles)
+// - The quad is sized in pixels: a circle of diameter `size`, padded by half
+//   a pixel so the anti-aliased edge fits inside it
+// - Fragment shader cuts the circle out of the square quad
 
 /// Vertex shader for scatter plots (advanced, with circular point support)
 ///
@@ -83,47 +85,114 @@ fn fs_main(in: VertexOutput) -> @location(0) vec4<f32> {
 }
 "#;
 
-/// Simple vertex shader (currently used for basic point rendering)
+/// How each point is rasterized; selects the shader specialization
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub enum PointShape {
+    /// One vertex per point, drawn as a single pixel (point size <= 1)
+    Pixel,
+    /// One instanced 6-vertex quad per point, masked to a circle
+    Quad,
+}
+
+impl PointShape {
+    /// Pick the cheapest shape that can draw points of `size` pixels
+    pub fn for_size(size: f32) -> Self {
+        if size <= 1.0 {
+            PointShape::Pixel
+        } else {
+            PointShape::Quad
+        }
+    }
+}
+
+/// Simple vertex shader template (currently used for basic point rendering)
 ///
 /// Pipeline Stage 1: VERTEX PROCESSING
-/// - Takes each vertex (point) from our Rust Vertex struct
-/// - Converts 2D position (x, y) to 4D GPU clip space (x, y, z, w)
-/// - Passes color through unchanged to fragment shader
+/// - `{{POINT_EXPANSION}}` picks the point index and its pixel offset:
+///   - Pixel: one vertex per point, `vertex_index` selects the point
+///   - Quad: draws are instanced, `instance_index` selects the point and
+///     `vertex_index` the quad corner, offset by `size` pixels via `viewport`
+/// - Pulls the point's x and y from two storage buffers
+/// - Passes the plot color, the corner's pixel offset from the point centre
+///   and the point radius in pixels to the fragment shader
 ///
-/// Input layout matches our Rust Vertex struct:
-/// - @location(0): position [x, y]
-/// - @location(1): color [r, g, b, a]
-/// - @location(2): size (not currently used)
+/// Bindings (group 0):
+/// - @binding(0): PointStyle uniform (color, viewport, size) shared by all points
+/// - @binding(1): xs, normalized x coordinates (one f32 per point)
+/// - @binding(2): ys, normalized y coordinates (one f32 per point)
 ///
-/// This shader does minimal work - just format conversion.
-/// Perfect for rendering millions of points quickly.
+/// There are no vertex buffers: the CPU uploads the x and y arrays as-is,
+/// with no interleaving or quad expansion ("vertex pulling").
+/// Use [`specialize`] to produce compilable WGSL.
 pub const SIMPLE_VERTEX_SHADER: &str = r#"
-struct VertexInput {
-    @location(0) position: vec2<f32>,
-    @location(1) color: vec4<f32>,
-    @location(2) size: f32,
+struct PointStyle {
+    color: vec4<f32>,
+    viewport: vec2<f32>,
+    size: f32,
 }
 
+@group(0) @binding(0)
+var<uniform> style: PointStyle;
+
+@group(0) @binding(1)
+var<storage, read> xs: array<f32>;
+
+@group(0) @binding(2)
+var<storage, read> ys: array<f32>;
+
 struct VertexOutput {
     @builtin(position) clip_position: vec4<f32>,
     @location(0) color: vec4<f32>,
+    @location(1) corner: vec2<f32>,
+    @location(2) radius: f32,
 }
 
 @vertex
-fn vs_main(vertex: VertexInput) -> VertexOutput {
+fn vs_main(
+    @builtin(vertex_index) vertex_index: u32,
+    @builtin(instance_index) instance_index: u32,
+) -> VertexOutput {
+{{POINT_EXPANSION}}
+    let center = vec2<f32>(xs[point_index], ys[point_index]);
+
     var out: VertexOutput;
-    out.clip_position = vec4<f32>(vertex.position, 0.0, 1.0);
-    out.color = vertex.color;
+    out.clip_position = vec4<f32>(center + offset, 0.0, 1.0);
+    out.color = style.color;
+    out.corner = corner;
+    out.radius = radius;
     return out;
 }
 "#;
 
-/// Simple fragment shader (currently used, solid color output)
+const PIXEL_EXPANSION: &str = r#"    // One vertex per point
+    let point_index = vertex_index;
+    let corner = vec2<f32>(0.0, 0.0);
+    let radius = 0.5;
+    let offset = vec2<f32>(0.0, 0.0);"#;
+
+const QUAD_EXPANSION: &str = r#"    // One instance per point; unit quad as two triangles, corners at (±1, ±1)
+    let point_index = instance_index;
+    var corners = array<vec2<f32>, 6>(
+        vec2<f32>(-1.0, -1.0), vec2<f32>(1.0, -1.0), vec2<f32>(-1.0, 1.0),
+        vec2<f32>(-1.0, 1.0), vec2<f32>(1.0, -1.0), vec2<f32>(1.0, 1.0),
+    );
+
+    // Corner offset in pixels: the point radius plus half a pixel, so pixels
+    // straddling the circle's edge are rasterized and can be blended
+    let radius = style.size * 0.5;
+    let corner = corners[vertex_index] * (radius + 0.5);
+
+    // Clip space spans 2 units across the viewport
+    let offset = corner * 2.0 / style.viewport;"#;
+
+/// Simple fragment shader template (currently used, solid points)
 ///
 /// Pipeline Stage 3: FRAGMENT/PIXEL PROCESSING
 /// - Runs once for each pixel that the point covers
-/// - Receives interpolated color from vertex shader
-/// - Returns color directly (no modifications)
+/// - `{{POINT_COVERAGE}}` computes the pixel's alpha:
+///   - Pixel: fully covered
+///   - Quad: the fraction of the pixel inside the circle, approximated by a
+///     one-pixel ramp centred on the edge, so small points stay solid
 ///
 /// For a scatter plot with 1 million points, this shader may run
 /// 1-4 million times per frame (depending on point sizes).
@@ -133,10 +202,32 @@ pub const SIMPLE_FRAGMENT_SHADER: &str = r#"
 struct VertexOutput {
     @builtin(position) clip_position: vec4<f32>,
     @location(0) color: vec4<f32>,
+    @location(1) corner: vec2<f32>,
+    @location(2) radius: f32,
 }
 
 @fragment
 fn fs_main(in: VertexOutput) -> @location(0) vec4<f32> {
-    return in.color;
+{{POINT_COVERAGE}}
+    return vec4<f32>(in.color.rgb, in.color.a * alpha);
 }
 "#;
+
+const PIXEL_COVERAGE: &str = r#"    let alpha = 1.0;"#;
+
+const QUAD_COVERAGE: &str = r#"    // Distance and radius are in pixels; the ramp straddles the edge
+    let alpha = clamp(in.radius - length(in.corner) + 0.5, 0.0, 1.0);"#;
+
+/// Fill the `{{...}}` markers of a shader template for `shape`
+///
+/// The unused branch is never emitted, so each pipeline compiles only the
+/// code its point shape needs.
+pub fn specialize(template: &str, shape: PointShape) -> String {
+    let (expansion, coverage) = match shape {
+        PointShape::Pixel => (PIXEL_EXPANSION, PIXEL_COVERAGE),
+        PointShape::Quad => (QUAD_EXPANSION, QUAD_COVERAGE),
+    };
+    template
+        .replace("{{POINT_EXPANSION}}", expansion)
+        .replace("{{POINT_COVERAGE}}", coverage)
+}
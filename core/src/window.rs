@@ -19,7 +19,7 @@ pub struct RenderWindow {
 }
 
 impl RenderWindow {
-    pub async fn new(event_loop: &ActiveEventLoop, chart_data: ChartData, title: &str) -> Self {
+    pub async fn new(event_loop: &ActiveEventLoop, chart_data: &ChartData, title: &str) -> Self {
         // Create window
         let window_attributes = winit::window::Window::default_attributes()
             .with_title(title)
@@ -92,7 +92,8 @@ impl RenderWindow {
         surface.configure(&device, &config);
 
         // Create renderer using WindowRenderer trait
-        let renderer = ScatterRenderer::new(&device, &config, chart_data);
+        let mut renderer = ScatterRenderer::new(&device, &queue, &config, chart_data);
+        renderer.set_viewport(&queue, config.width as f32, config.height as f32);
 
         Self {
             window,
@@ -152,6 +153,8 @@ impl RenderWindow {
             self.config.width = new_size.width;
             self.config.height = new_size.height;
             self.surface.configure(&self.device, &self.config);
+            self.renderer
+                .set_viewport(&self.queue, new_size.width as f32, new_size.height as f32);
         }
     }
 
@@ -160,14 +163,14 @@ impl RenderWindow {
     }
 }
 
-struct App {
-    chart_data: Option<ChartData>,
+struct App<'a> {
+    chart_data: Option<&'a ChartData>,
     title: String,
     window: Option<RenderWindow>,
 }
 
-impl App {
-    fn new(chart_data: ChartData, title: String) -> Self {
+impl<'a> App<'a> {
+    fn new(chart_data: &'a ChartData, title: String) -> Self {
         Self {
             chart_data: Some(chart_data),
             title,
@@ -176,7 +179,7 @@ impl App {
     }
 }
 
-impl ApplicationHandler for App {
+impl ApplicationHandler for App<'_> {
     fn resumed(&mut self, event_loop: &ActiveEventLoop) {
         if self.window.is_none() {
             if let Some(chart_data) = self.chart_data.take() {
@@ -223,7 +226,11 @@ impl ApplicationHandler for App {
     }
 }
 
-pub fn run_window(chart_data: ChartData, title: &str) {
+/// Open a window and render `chart_data` until it is closed
+///
+/// The data is borrowed for the lifetime of the event loop, so opening the
+/// window does not copy its points.
+pub fn run_window(chart_data: &ChartData, title: &str) {
     env_logger::init();
     
     let event_loop = EventLoop::new().expect("Failed to create event loop");
@@ -0,0 +1,110 @@
+use helion_core::kernels::*;
+
+// Note: On x86_64 machines with AVX2 these exercise the SIMD paths; lengths
+// that are not a multiple of the vector width also cover the scalar tails.
+
+#[test]
+fn test_min_max_f32() {
+    let data = vec![3.0, -1.5, 7.25, 0.0, 2.0];
+    assert_eq!(min_max_f32(&data), (-1.5, 7.25));
+}
+
+#[test]
+fn test_min_max_ignores_nan() {
+    let data = vec![1.0, f64::NAN, -2.0];
+    assert_eq!(min_max_f64(&data), (-2.0, 1.0));
+}
+
+#[test]
+fn test_min_max_matches_scalar_with_nan_and_tails() {
+    // Lengths around the 8/32-lane (f32) and 4/16-lane (f64) block sizes
+    for n in [1, 7, 8, 9, 31, 32, 33, 100, 1003] {
+        let mut data: Vec<f64> = (0..n).map(|i| ((i * 7919) % 1000) as f64 - 500.0).collect();
+        data[n / 2] = f64::NAN;
+        let data32: Vec<f32> = data.iter().map(|&v| v as f32).collect();
+
+        let expected = data.iter().fold((f64::INFINITY, f64::NEG_INFINITY), |(lo, hi), &v| (lo.min(v), hi.max(v)));
+        assert_eq!(min_max_f64(&data), expected);
+        assert_eq!(min_max_f32(&data32), (expected.0 as f32, expected.1 as f32));
+    }
+}
+
+#[test]
+fn test_min_max_empty() {
+    assert_eq!(min_max_f32(&[]), (f32::INFINITY, f32::NEG_INFINITY));
+}
+
+/// Scalar reference for the range map kernels
+fn map_ref(x: f64, (lo, hi): (f64, f64), (out_lo, out_hi): (f64, f64)) -> f32 {
+    let span = hi - lo;
+    ((hi - x) * (out_lo / span) + (x - lo) * (out_hi / span)) as f32
+}
+
+const FROM: (f64, f64) = (-50.0, 321.11);
+const TO: (f64, f64) = (-1.0, 1.0);
+
+#[test]
+fn test_map_f32_matches_scalar() {
+    let src: Vec<f32> = (0..1003).map(|i| i as f32 * 0.37 - 50.0).collect();
+    let mut dst = vec![0.0; src.len()];
+    map_f32(&src, &mut dst, FROM, TO);
+
+    for (s, d) in src.iter().zip(&dst) {
+        assert_eq!(*d, map_ref(*s as f64, FROM, TO));
+    }
+}
+
+#[test]
+fn test_cast_and_map_f64_to_f32_matches_scalar() {
+    let src: Vec<f64> = (0..1003).map(|i| i as f64 * 0.37 - 50.0).collect();
+    let mut dst = vec![0.0; src.len()];
+    cast_and_map_f64_to_f32(&src, &mut dst, FROM, TO);
+
+    for (s, d) in src.iter().zip(&dst) {
+        assert_eq!(*d, map_ref(*s, FROM, TO));
+    }
+}
+
+#[test]
+fn test_parallel_maps_match_scalar() {
+    // Large enough to be split across threads, with a ragged final chunk
+    let n = PARALLEL_THRESHOLD + PARALLEL_CHUNK / 2 + 3;
+    let src: Vec<f64> = (0..n).map(|i| i as f64 * 0.37 - 50.0).collect();
+    let src_f32: Vec<f32> = src.iter().map(|&v| v as f32).collect();
+
+    let mut dst = vec![0.0; n];
+    cast_and_map_f64_to_f32(&src, &mut dst, FROM, TO);
+    for (s, d) in src.iter().zip(&dst) {
+        assert_eq!(*d, map_ref(*s, FROM, TO));
+    }
+
+    map_f32(&src_f32, &mut dst, FROM, TO);
+    for (s, d) in src_f32.iter().zip(&dst) {
+        assert_eq!(*d, map_ref(*s as f64, FROM, TO));
+    }
+}
+
+#[test]
+fn test_map_endpoints_are_exact_with_zero_bounds() {
+    // A zero output bound must not pick up a rounding residue at either end
+    let src = [0.1f64, 0.3, 0.7, 49.1];
+    let src_f32 = src.map(|v| v as f32);
+    let mut dst = [9.0f32; 4];
+    for to in [(0.0, 1.0), (-1.0, 0.0), (0.0, 0.3), (-0.7, 0.0)] {
+        cast_and_map_f64_to_f32(&src, &mut dst, (0.1, 49.1), to);
+        assert_eq!((dst[0], dst[3]), (to.0 as f32, to.1 as f32));
+
+        let from = (src_f32[0] as f64, src_f32[3] as f64);
+        map_f32(&src_f32, &mut dst, from, to);
+        assert_eq!((dst[0], dst[3]), (to.0 as f32, to.1 as f32));
+    }
+}
+
+#[test]
+fn test_map_writes_only_source_length() {
+    // A longer destination is allowed; extra elements are left untouched
+    let src = vec![1.0f64, 2.0];
+    let mut dst = vec![9.0f32; 4];
+    cast_and_map_f64_to_f32(&src, &mut dst, (1.0, 2.0), (2.0, 4.0));
+    assert_eq!(dst, vec![2.0, 4.0, 9.0, 9.0]);
+}
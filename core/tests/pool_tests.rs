@@ -0,0 +1,34 @@
+use helion_core::pool::{bucket_size, BufferPool, BUCKET_SIZE};
+
+// Note: acquiring and releasing real buffers requires a GPU device.
+// These tests cover the size bucketing that decides which buffers are reused.
+
+#[test]
+fn test_bucket_size_rounds_up_to_64kb() {
+    assert_eq!(BUCKET_SIZE, 65536);
+    assert_eq!(bucket_size(1), BUCKET_SIZE);
+    assert_eq!(bucket_size(BUCKET_SIZE), BUCKET_SIZE);
+    assert_eq!(bucket_size(BUCKET_SIZE + 4), 2 * BUCKET_SIZE);
+}
+
+#[test]
+fn test_bucket_size_of_empty_upload() {
+    // Zero-sized buffers cannot be bound, so even empty requests get a bucket
+    assert_eq!(bucket_size(0), BUCKET_SIZE);
+}
+
+#[test]
+fn test_similar_sizes_share_a_bucket() {
+    // 10k points at 4 bytes each vs. a slightly different plot size
+    assert_eq!(bucket_size(40_000), bucket_size(50_000));
+    // 1M points is a whole number of buckets
+    assert_eq!(bucket_size(4_000_000) % BUCKET_SIZE, 0);
+    assert!(bucket_size(4_000_000) >= 4_000_000);
+}
+
+#[test]
+fn test_new_pool_is_empty() {
+    let mut pool = BufferPool::new();
+    assert!(pool.is_empty());
+    assert!(pool.take(1024, wgpu::BufferUsages::STORAGE).is_none());
+}
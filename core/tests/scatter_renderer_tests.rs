@@ -12,10 +12,16 @@ fn test_scatter_renderer_struct_size() {
     use helion_core::scatter::ScatterRenderer;
     
     // ScatterRenderer should be relatively small
-    // Contains: render_pipeline, Option<Buffer>, u32
+    // Contains: active pipeline + shape/format, pipeline cache (HashMap),
+    // bind group layout, style buffer, viewport, coordinate buffers + bind
+    // group, BufferPool and StagingBelt. The maps and belt keep their entries
+    // on the heap; only their inline bookkeeping counts here.
     let size = size_of::<ScatterRenderer>();
     
-    // Should be less than 1KB (currently around 100-200 bytes)
+    // Should be less than 1KB. With two pooled coordinate Buffers, the bind
+    // group, the style buffer, two HashMaps (pipeline cache, pool free-lists)
+    // and the StagingBelt's bookkeeping it is now several hundred bytes, so
+    // the bound leaves room for roughly one more set of GPU handles.
     assert!(size < 1024, "ScatterRenderer is unexpectedly large: {} bytes", size);
 }
 
@@ -28,25 +34,25 @@ fn test_chart_data_for_scatter_rendering() {
     
     let data = ChartData::from_scatter(&x, &y, Some(color), Some(3.0), 800.0, 600.0);
     
-    assert_eq!(data.vertices.len(), 3);
+    assert_eq!(data.len(), 3);
     assert_eq!(data.viewport_width, 800.0);
     assert_eq!(data.viewport_height, 600.0);
     
-    // Verify vertex data is properly formatted for GPU
-    for vertex in &data.vertices {
+    // Verify point data is properly formatted for GPU
+    for (&x, &y) in data.xs.iter().zip(&data.ys) {
         // Position should be normalized to [-1, 1]
-        assert!(vertex.position[0] >= -1.0 && vertex.position[0] <= 1.0);
-        assert!(vertex.position[1] >= -1.0 && vertex.position[1] <= 1.0);
-        
-        // Color should be valid
-        assert_eq!(vertex.color[0], 1.0); // Red
-        assert_eq!(vertex.color[1], 0.0); // Green
-        assert_eq!(vertex.color[2], 0.0); // Blue
-        assert_eq!(vertex.color[3], 1.0); // Alpha
-        
-        // Size should match
-        assert_eq!(vertex.size, 3.0);
+        assert!(x >= -1.0 && x <= 1.0);
+        assert!(y >= -1.0 && y <= 1.0);
     }
+    
+    // Color and size are shared by all points via the style uniform
+    let style = data.style();
+    assert_eq!(style.color[0], 1.0); // Red
+    assert_eq!(style.color[1], 0.0); // Green
+    assert_eq!(style.color[2], 0.0); // Blue
+    assert_eq!(style.color[3], 1.0); // Alpha
+    assert_eq!(style.size, 3.0);
+    assert_eq!(style.viewport, [800.0, 600.0]);
 }
 
 #[test]
@@ -61,15 +67,15 @@ fn test_chart_data_with_custom_x_range() {
         None,              // Default y range [-1, 1]
     );
     
-    assert_eq!(data.vertices.len(), 3);
+    assert_eq!(data.len(), 3);
     
     // x should be in [0, 1] range
-    assert_eq!(data.vertices[0].position[0], 0.0);  // min x maps to 0
-    assert_eq!(data.vertices[2].position[0], 1.0);  // max x maps to 1
+    assert_eq!(data.xs[0], 0.0);  // min x maps to 0
+    assert_eq!(data.xs[2], 1.0);  // max x maps to 1
     
     // y should be in default [-1, 1] range
-    assert_eq!(data.vertices[0].position[1], -1.0); // min y maps to -1
-    assert_eq!(data.vertices[2].position[1], 1.0);  // max y maps to 1
+    assert_eq!(data.ys[0], -1.0); // min y maps to -1
+    assert_eq!(data.ys[2], 1.0);  // max y maps to 1
 }
 
 #[test]
@@ -85,12 +91,12 @@ fn test_chart_data_with_custom_y_range() {
     );
     
     // x should be in default [-1, 1] range
-    assert_eq!(data.vertices[0].position[0], -1.0);
-    assert_eq!(data.vertices[1].position[0], 1.0);
+    assert_eq!(data.xs[0], -1.0);
+    assert_eq!(data.xs[1], 1.0);
     
     // y should be in custom [0, 2] range
-    assert_eq!(data.vertices[0].position[1], 0.0);  // min y maps to 0
-    assert_eq!(data.vertices[1].position[1], 2.0);  // max y maps to 2
+    assert_eq!(data.ys[0], 0.0);  // min y maps to 0
+    assert_eq!(data.ys[1], 2.0);  // max y maps to 2
 }
 
 #[test]
@@ -106,12 +112,42 @@ fn test_chart_data_with_both_custom_ranges() {
     );
     
     // x should be in [-0.5, 0.5] range
-    assert_eq!(data.vertices[0].position[0], -0.5); // min x maps to -0.5
-    assert_eq!(data.vertices[1].position[0], 0.5);  // max x maps to 0.5
+    assert_eq!(data.xs[0], -0.5); // min x maps to -0.5
+    assert_eq!(data.xs[1], 0.5);  // max x maps to 0.5
     
     // y should be in [0, 1] range
-    assert_eq!(data.vertices[0].position[1], 0.0);  // min y maps to 0
-    assert_eq!(data.vertices[1].position[1], 1.0);  // max y maps to 1
+    assert_eq!(data.ys[0], 0.0);  // min y maps to 0
+    assert_eq!(data.ys[1], 1.0);  // max y maps to 1
+}
+
+#[test]
+fn test_chart_data_range_endpoints_are_exact() {
+    // Non-zero data minimum with a zero output bound: no rounding residue
+    let x = vec![0.1, 0.3, 0.7];
+    let y = vec![0.1, 0.3, 0.7];
+    
+    let data = ChartData::from_scatter_with_range(
+        &x, &y, None, None, 800.0, 600.0,
+        Some((0.0, 1.0)),
+        Some((-1.0, 0.0)),
+    );
+    
+    assert_eq!(data.xs[0], 0.0);
+    assert_eq!(data.xs[2], 1.0);
+    assert_eq!(data.ys[0], -1.0);
+    assert_eq!(data.ys[2], 0.0);
+    
+    let x64: Vec<f64> = x.iter().map(|&v| v as f64).collect();
+    let data = ChartData::from_scatter_f64_with_range(
+        &x64, &x64, None, None, 800.0, 600.0,
+        Some((0.0, 1.0)),
+        Some((-1.0, 0.0)),
+    );
+    
+    assert_eq!(data.xs[0], 0.0);
+    assert_eq!(data.xs[2], 1.0);
+    assert_eq!(data.ys[0], -1.0);
+    assert_eq!(data.ys[2], 0.0);
 }
 
 #[test]
@@ -127,8 +163,8 @@ fn test_chart_data_with_inverted_y_range() {
     );
     
     // y coordinates should be inverted
-    assert_eq!(data.vertices[0].position[1], 1.0);  // min y maps to 1 (top)
-    assert_eq!(data.vertices[1].position[1], -1.0); // max y maps to -1 (bottom)
+    assert_eq!(data.ys[0], 1.0);  // min y maps to 1 (top)
+    assert_eq!(data.ys[1], -1.0); // max y maps to -1 (bottom)
 }
 
 #[test]
@@ -136,7 +172,7 @@ fn test_empty_chart_data() {
     // Rendering with empty data should be handled gracefully
     let data = ChartData::new(800.0, 600.0);
     
-    assert_eq!(data.vertices.len(), 0);
+    assert_eq!(data.len(), 0);
     // update_data() should handle empty data without panicking
     // (actual test would require GPU backend)
 }
@@ -151,25 +187,26 @@ fn test_large_dataset_structure() {
     
     let data = ChartData::from_scatter(&x, &y, None, None, 1920.0, 1080.0);
     
-    assert_eq!(data.vertices.len(), size);
+    assert_eq!(data.len(), size);
     
-    // Verify memory layout is compact (important for GPU transfer)
-    let vertex_size = std::mem::size_of::<helion_core::data::Vertex>();
-    assert_eq!(vertex_size, 40); // 2 floats + 4 floats + 1 float + 3 padding = 10 * 4 bytes
+    // Verify memory layout is compact (important for GPU transfer):
+    // one f32 per axis per point, no per-point color or size
+    assert_eq!(data.xs.len(), size);
+    assert_eq!(data.ys.len(), size);
 }
 
 #[test]
 fn test_vertex_alignment() {
-    // GPU requires proper alignment - verify our Vertex struct is correctly aligned
+    // GPU requires proper alignment - verify our vertex and uniform structs are correctly aligned
     use std::mem::{align_of, size_of};
-    use helion_core::data::Vertex;
+    use helion_core::data::PointStyle;
     
-    // Check that size is a multiple of 4 bytes (f32 alignment)
-    assert_eq!(size_of::<Vertex>(), 40);
+    // Uniform structs must be a multiple of 16 bytes
+    assert_eq!(size_of::<PointStyle>() % 16, 0);
     
-    // Vertex should be at least 4-byte aligned (f32 requirement)
-    let alignment = align_of::<Vertex>();
-    assert!(alignment >= 4, "Vertex alignment should be at least 4 bytes");
+    // PointStyle should be at least 4-byte aligned (f32 requirement)
+    let alignment = align_of::<PointStyle>();
+    assert!(alignment >= 4, "PointStyle alignment should be at least 4 bytes");
 }
 
 // Integration test note:
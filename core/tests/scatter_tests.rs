@@ -7,7 +7,7 @@ fn test_scatter_basic_creation() {
     
     let data = ChartData::from_scatter(&x, &y, None, None, 800.0, 600.0);
     
-    assert_eq!(data.vertices.len(), 3);
+    assert_eq!(data.len(), 3);
     assert_eq!(data.viewport_width, 800.0);
     assert_eq!(data.viewport_height, 600.0);
 }
@@ -21,10 +21,10 @@ fn test_scatter_normalization_to_clip_space() {
     let data = ChartData::from_scatter(&x, &y, None, None, 800.0, 600.0);
     
     // First point should be at (-1, -1), last at (1, 1)
-    assert_eq!(data.vertices[0].position[0], -1.0);
-    assert_eq!(data.vertices[0].position[1], -1.0);
-    assert_eq!(data.vertices[1].position[0], 1.0);
-    assert_eq!(data.vertices[1].position[1], 1.0);
+    assert_eq!(data.xs[0], -1.0);
+    assert_eq!(data.ys[0], -1.0);
+    assert_eq!(data.xs[1], 1.0);
+    assert_eq!(data.ys[1], 1.0);
 }
 
 #[test]
@@ -40,10 +40,27 @@ fn test_scatter_custom_range() {
     );
     
     // First point should be at (0, 0), last at (1, 1)
-    assert_eq!(data.vertices[0].position[0], 0.0);
-    assert_eq!(data.vertices[0].position[1], 0.0);
-    assert_eq!(data.vertices[1].position[0], 1.0);
-    assert_eq!(data.vertices[1].position[1], 1.0);
+    assert_eq!(data.xs[0], 0.0);
+    assert_eq!(data.ys[0], 0.0);
+    assert_eq!(data.xs[1], 1.0);
+    assert_eq!(data.ys[1], 1.0);
+}
+
+#[test]
+fn test_scatter_f64_matches_f32() {
+    // The fused f64 path must produce the same points as the f32 path
+    let x = vec![0.0, 2.5, 10.0];
+    let y = vec![-4.0, 0.0, 4.0];
+    let x64: Vec<f64> = x.iter().map(|&v: &f32| v as f64).collect();
+    let y64: Vec<f64> = y.iter().map(|&v: &f32| v as f64).collect();
+
+    let data32 = ChartData::from_scatter_with_range(&x, &y, None, None, 800.0, 600.0, Some((0.0, 1.0)), None);
+    let data64 = ChartData::from_scatter_f64_with_range(&x64, &y64, None, None, 800.0, 600.0, Some((0.0, 1.0)), None);
+
+    assert_eq!(data64.len(), 3);
+    assert_eq!(data32.xs, data64.xs);
+    assert_eq!(data32.ys, data64.ys);
+    assert_eq!((data64.xs[1], data64.ys[1]), (0.25, 0.0));
 }
 
 #[test]
@@ -55,12 +72,12 @@ fn test_scatter_with_color_and_size() {
     let data = ChartData::from_scatter(&x, &y, Some(color), Some(5.0), 800.0, 600.0);
     
     // Check color is applied
-    assert_eq!(data.vertices[0].color[0], 1.0); // R
-    assert_eq!(data.vertices[0].color[1], 0.0); // G
-    assert_eq!(data.vertices[0].color[2], 0.0); // B
+    assert_eq!(data.color.r, 1.0); // R
+    assert_eq!(data.color.g, 0.0); // G
+    assert_eq!(data.color.b, 0.0); // B
     
     // Check size is applied
-    assert_eq!(data.vertices[0].size, 5.0);
+    assert_eq!(data.point_size, 5.0);
 }
 
 #[test]
@@ -71,7 +88,7 @@ fn test_scatter_mismatched_arrays() {
     let data = ChartData::from_scatter(&x, &y, None, None, 800.0, 600.0);
     
     // Should only create points for matching pairs
-    assert_eq!(data.vertices.len(), 2);
+    assert_eq!(data.len(), 2);
 }
 
 #[test]
@@ -89,18 +106,45 @@ fn test_color_from_hex() {
     assert_eq!(red_half.a, 0.5019608); // 128/255
 }
 
+#[test]
+fn test_color_from_hex_case_and_prefix() {
+    // Lowercase digits and a missing '#' decode the same as uppercase
+    let upper = Color::from_hex("#FF5733AA");
+    let lower = Color::from_hex("ff5733aa");
+    assert_eq!((upper.r, upper.g, upper.b, upper.a), (lower.r, lower.g, lower.b, lower.a));
+    assert_eq!(upper.g, 87.0 / 255.0); // 0x57
+    assert_eq!(upper.a, 170.0 / 255.0); // 0xAA
+
+    // Invalid pairs fall back to 0 per channel
+    let partial = Color::from_hex("#GG8000");
+    assert_eq!(partial.r, 0.0);
+    assert_eq!(partial.g, 128.0 / 255.0);
+    assert_eq!(partial.a, 1.0);
+}
+
 #[test]
 fn test_add_point() {
     let mut data = ChartData::new(800.0, 600.0);
     
-    data.add_point(
-        Point2D::new(0.5, -0.5),
-        Color::default(),
-        3.0
-    );
+    data.add_point(Point2D::new(0.5, -0.5));
     
-    assert_eq!(data.vertices.len(), 1);
-    assert_eq!(data.vertices[0].position[0], 0.5);
-    assert_eq!(data.vertices[0].position[1], -0.5);
-    assert_eq!(data.vertices[0].size, 3.0);
+    assert_eq!(data.len(), 1);
+    assert_eq!(data.xs[0], 0.5);
+    assert_eq!(data.ys[0], -0.5);
+}
+
+#[test]
+fn test_generation_tracks_changes() {
+    let mut data = ChartData::from_scatter(&[0.0, 1.0], &[0.0, 1.0], None, None, 800.0, 600.0);
+
+    // Reading the generation does not consume it, so every renderer sees it
+    let initial = data.generation();
+    assert_eq!(data.generation(), initial);
+
+    data.add_point(Point2D::new(0.0, 0.0));
+    let after_add = data.generation();
+    assert_ne!(after_add, initial);
+
+    data.mark_dirty();
+    assert_ne!(data.generation(), after_add);
 }
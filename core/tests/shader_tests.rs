@@ -28,10 +28,15 @@ fn test_simple_fragment_shader_has_entry_point() {
 
 #[test]
 fn test_vertex_shader_input_locations() {
-    // Ensure vertex shader expects data at correct locations matching our Vertex struct
-    assert!(SIMPLE_VERTEX_SHADER.contains("@location(0) position"));
-    assert!(SIMPLE_VERTEX_SHADER.contains("@location(1) color"));
-    assert!(SIMPLE_VERTEX_SHADER.contains("@location(2) size"));
+    // Ensure vertex shader pulls coordinates from the bindings ScatterRenderer creates
+    assert!(SIMPLE_VERTEX_SHADER.contains("@builtin(vertex_index)"));
+    assert!(SIMPLE_VERTEX_SHADER.contains("@builtin(instance_index)"));
+    assert!(SIMPLE_VERTEX_SHADER.contains("@binding(1)\nvar<storage, read> xs: array<f32>"));
+    assert!(SIMPLE_VERTEX_SHADER.contains("@binding(2)\nvar<storage, read> ys: array<f32>"));
+    
+    // Color and size come from the PointStyle uniform, not per-vertex attributes
+    assert!(SIMPLE_VERTEX_SHADER.contains("var<uniform> style: PointStyle"));
+    assert!(!SIMPLE_VERTEX_SHADER.contains("@location(0) position"));
 }
 
 #[test]
@@ -41,6 +46,63 @@ fn test_vertex_shader_output_types() {
     assert!(SIMPLE_VERTEX_SHADER.contains("vec4<f32>")); // Color and clip position
 }
 
+#[test]
+fn test_simple_shaders_draw_round_points() {
+    // Point size is applied in pixels, so the vertex shader needs the viewport
+    assert!(SIMPLE_VERTEX_SHADER.contains("viewport: vec2<f32>"));
+    assert!(SIMPLE_VERTEX_SHADER.contains("@location(1) corner"));
+    assert!(SIMPLE_FRAGMENT_SHADER.contains("@location(1) corner"));
+
+    let vertex = specialize(SIMPLE_VERTEX_SHADER, PointShape::Quad);
+    let fragment = specialize(SIMPLE_FRAGMENT_SHADER, PointShape::Quad);
+    assert!(vertex.contains("let point_index = instance_index"));
+    assert!(vertex.contains("corner * 2.0 / style.viewport"));
+    assert!(fragment.contains("length(in.corner)"));
+}
+
+#[test]
+fn test_quad_coverage_at_default_size() {
+    // Coverage is computed in pixels with a one-pixel ramp centred on the
+    // edge, and the quad is padded by half a pixel so that ramp is rasterized
+    let vertex = specialize(SIMPLE_VERTEX_SHADER, PointShape::Quad);
+    let fragment = specialize(SIMPLE_FRAGMENT_SHADER, PointShape::Quad);
+    assert!(vertex.contains("let radius = style.size * 0.5;"));
+    assert!(vertex.contains("corners[vertex_index] * (radius + 0.5)"));
+    assert!(fragment.contains("clamp(in.radius - length(in.corner) + 0.5, 0.0, 1.0)"));
+    // Screen-space derivatives vanish on tiny quads
+    assert!(!fragment.contains("fwidth"));
+
+    // At the default size of 2 px, the four pixels around the centre (0.707 px
+    // away) are mostly covered and the ones diagonally outside are not
+    let coverage = |size: f32, dist: f32| (size * 0.5 - dist + 0.5).clamp(0.0, 1.0);
+    assert!(coverage(2.0, 0.5f32.hypot(0.5)) > 0.75);
+    assert_eq!(coverage(2.0, 0.5), 1.0);
+    assert_eq!(coverage(2.0, 1.5f32.hypot(1.5)), 0.0);
+}
+
+#[test]
+fn test_pixel_specialization_is_stripped() {
+    // 1-pixel points pull one vertex per point and skip the circle mask
+    let vertex = specialize(SIMPLE_VERTEX_SHADER, PointShape::Pixel);
+    let fragment = specialize(SIMPLE_FRAGMENT_SHADER, PointShape::Pixel);
+    assert!(vertex.contains("let point_index = vertex_index"));
+    assert!(!vertex.contains("corners"));
+    assert!(!fragment.contains("length(in.corner)"));
+
+    for shape in [PointShape::Pixel, PointShape::Quad] {
+        for template in [SIMPLE_VERTEX_SHADER, SIMPLE_FRAGMENT_SHADER] {
+            assert!(!specialize(template, shape).contains("{{"));
+        }
+    }
+}
+
+#[test]
+fn test_point_shape_for_size() {
+    assert_eq!(PointShape::for_size(1.0), PointShape::Pixel);
+    assert_eq!(PointShape::for_size(0.5), PointShape::Pixel);
+    assert_eq!(PointShape::for_size(2.0), PointShape::Quad);
+}
+
 #[test]
 fn test_scatter_shaders_exist() {
     // Advanced shaders are present (even if not currently used)
@@ -27,8 +27,10 @@ def main():
     
     print("✓ Scatter plot created successfully!")
     print(f"  - Points: {n_points:,}")
-    print(f"  - X range: [{x.min():.3f}, {x.max():.3f}]")
-    print(f"  - Y range: [{y.min():.3f}, {y.max():.3f}]")
+    x_min, x_max = helion.minmax(x)
+    y_min, y_max = helion.minmax(y)
+    print(f"  - X range: [{x_min:.3f}, {x_max:.3f}]")
+    print(f"  - Y range: [{y_min:.3f}, {y_max:.3f}]")
     print(f"  - Color: #FF5733 (coral red)")
     print("")
     print("Opening window... Close window to exit.")
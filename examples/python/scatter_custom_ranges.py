@@ -19,8 +19,10 @@ def main():
     y = np.random.uniform(0, 100, n).astype(np.float32)
     
     print(f"\nGenerated {n:,} points")
-    print(f"X data range: [{x.min():.2f}, {x.max():.2f}]")
-    print(f"Y data range: [{y.min():.2f}, {y.max():.2f}]")
+    x_min, x_max = helion.minmax(x)
+    y_min, y_max = helion.minmax(y)
+    print(f"X data range: [{x_min:.2f}, {x_max:.2f}]")
+    print(f"Y data range: [{y_min:.2f}, {y_max:.2f}]")
     
     # Example 1: Default mapping to [-1, 1] (GPU clip space)
     print("\n1. Default mapping to [-1, 1]:")
@@ -60,7 +62,7 @@ def main():
     # Example 5: Preserve aspect ratio by using data bounds
     print("\n5. Data-driven square mapping:")
     # Map to square [-1, 1] preserving data aspect ratio
-    data_aspect = (x.max() - x.min()) / (y.max() - y.min())
+    data_aspect = (x_max - x_min) / (y_max - y_min)
     if data_aspect > 1:
         # Data is wider than tall
         x_out = (-1.0, 1.0)
@@ -6,7 +6,6 @@ efficiently by rendering 1 million points.
 """
 
 import helion
-import numpy as np
 import time
 
 def main():
@@ -20,9 +19,7 @@ def main():
     print(f"\nGenerating {n_points:,} random points...")
     start_time = time.time()
     
-    np.random.seed(42)
-    x = np.random.randn(n_points).astype(np.float32)
-    y = np.random.randn(n_points).astype(np.float32)
+    x, y = helion.random_points(n_points, seed=42)
     
     gen_time = time.time() - start_time
     print(f"✓ Data generated in {gen_time:.3f}s")
@@ -41,8 +38,10 @@ def main():
     print("RESULTS")
     print("=" * 60)
     print(f"Data Points:     {n_points:,}")
-    print(f"X Range:         [{x.min():.3f}, {x.max():.3f}]")
-    print(f"Y Range:         [{y.min():.3f}, {y.max():.3f}]")
+    x_min, x_max = helion.minmax(x)
+    y_min, y_max = helion.minmax(y)
+    print(f"X Range:         [{x_min:.3f}, {x_max:.3f}]")
+    print(f"Y Range:         [{y_min:.3f}, {y_max:.3f}]")
     print(f"Memory (X+Y):    {(x.nbytes + y.nbytes) / 1024 / 1024:.2f} MB")
     print(f"Generation Time: {gen_time:.3f}s")
     print(f"Plot Time:       {plot_time:.3f}s")